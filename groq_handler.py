@@ -12,13 +12,14 @@ Goals:
 import json
 import re
 import random
+from itertools import islice
 from typing import Any, Dict, List, Optional
 
 from groq import Groq
 
 from config import GROQ_API_KEY, GROQ_MODEL
 from models import ScamDetectionResult, ScamIndicator
-from state_manager import DynamicStateManager
+from state_manager import DynamicStateManager, EMOTION_LABELS
 
 
 class GroqHandler:
@@ -266,7 +267,7 @@ class GroqHandler:
         if state_mgr:
             base.append("")
             base.append("EMOTIONAL STATE:")
-            base.append(f"- Progression level: {state_mgr.current_emotion.value.replace('_', ' ').title()}")
+            base.append(f"- Progression level: {EMOTION_LABELS[state_mgr.current_emotion]}")
             base.append(f"- {state_mgr.get_emotional_context()}")
             
             # NEW: Add sentiment shift guidance
@@ -344,10 +345,10 @@ class GroqHandler:
             base.append("- Categories: CONFUSION (UI questions), SKEPTICAL (doubt scammer), SLOW_COMPLIANCE (realistic delays)")
             base.append("- FORBIDDEN: Same category twice in a row.")
             next_tactic = state_mgr.get_next_tactic()
-            base.append(f"- Suggested {next_cat} tactic: '{next_tactic['text']}'")
+            base.append(f"- Suggested {next_cat} tactic: '{next_tactic.text}'")
             if state_mgr.used_tactics:
-                recent_tactics = state_mgr.used_tactics[-3:]
-                base.append(f"- Recent tactics used: {', '.join([t['category'] + ': ' + t['text'][:40] for t in recent_tactics])}")
+                recent_tactics = list(islice(reversed(state_mgr.used_tactics), 3))[::-1]
+                base.append(f"- Recent tactics used: {', '.join([t.category + ': ' + t.text[:40] for t in recent_tactics])}")
             
             # NEW: Strategic Intel Baiting
             missing = state_mgr.get_missing_facts()
@@ -744,15 +745,18 @@ class GroqHandler:
         #    same structural pattern (e.g., "panic + data_ref + what_if + fear_lock") even
         #    though exact words differ. Forces a completely different response type.
         if state_mgr:
-            if state_mgr.is_structurally_repetitive(reply):
+            skeleton = state_mgr.extract_response_skeleton(reply)
+            if state_mgr.is_structurally_repetitive(reply, skeleton=skeleton):
                 print(f"[GROQ-GUARDRAIL] Structural monotony detected (same pattern 3+ turns), forcing diversity break")
                 diversity_reply = state_mgr.get_diversity_replacement()
                 if diversity_reply:
+                    # The replaced reply is never sent, so its skeleton is not recorded
                     reply = self._truncate_to_two_sentences(diversity_reply)
+                    skeleton = None
 
-        # Record the structural skeleton of the final response for future comparison
-        if state_mgr:
-            state_mgr.record_response_skeleton(reply)
+            # Record the structural skeleton of the final response for future comparison,
+            # reusing the one computed above when the reply was kept
+            state_mgr.record_response_skeleton(reply, skeleton=skeleton)
 
         return reply
 
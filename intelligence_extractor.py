@@ -46,6 +46,21 @@ class IntelligenceExtractor:
             ],
         }
         
+        # Context right before a number that marks it as NOT a bank account
+        # (employee ID, case number, ...), merged into one alternation
+        non_account_patterns = [
+            r'employee\s*id[:\s]*',
+            r'emp[:\s]*id[:\s]*',
+            r'staff\s*id[:\s]*',
+            r'id\s*(?:number|no)?[:\s]*',
+            r'case\s*(?:number|no)?[:\s]*',
+            r'reference\s*(?:number|no)?[:\s]*',
+            r'complaint\s*(?:number|no)?[:\s]*',
+            r'ticket\s*(?:number|no)?[:\s]*',
+            r'order\s*(?:number|no)?[:\s]*',
+        ]
+        self.non_account_context = re.compile('|'.join(non_account_patterns), re.IGNORECASE)
+        
         # Suspicious keywords to detect
         self.suspicious_keywords = [
             'urgent', 'immediately', 'verify now', 'account blocked', 'suspended',
@@ -114,19 +129,6 @@ class IntelligenceExtractor:
         accounts = set()
         text_lower = text.lower()
         
-        # Patterns that indicate a number is NOT a bank account
-        non_account_patterns = [
-            r'employee\s*id[:\s]*',
-            r'emp[:\s]*id[:\s]*',
-            r'staff\s*id[:\s]*',
-            r'id\s*(?:number|no)?[:\s]*',
-            r'case\s*(?:number|no)?[:\s]*',
-            r'reference\s*(?:number|no)?[:\s]*',
-            r'complaint\s*(?:number|no)?[:\s]*',
-            r'ticket\s*(?:number|no)?[:\s]*',
-            r'order\s*(?:number|no)?[:\s]*',
-        ]
-        
         for pattern in self.patterns["bank_account"]:
             for match in pattern.finditer(text):
                 clean_match = re.sub(r'[\s-]', '', match.group())
@@ -139,13 +141,7 @@ class IntelligenceExtractor:
                     start_pos = match.start()
                     context_before = text_lower[max(0, start_pos - 30):start_pos]
                     
-                    is_non_account = False
-                    for non_pattern in non_account_patterns:
-                        if re.search(non_pattern, context_before, re.IGNORECASE):
-                            is_non_account = True
-                            break
-                    
-                    if not is_non_account:
+                    if not self.non_account_context.search(context_before):
                         accounts.add(clean_match)
         
         return list(accounts)
@@ -80,7 +80,7 @@ TONE RULE: Use periods and commas, NOT exclamation marks. Real panicked people s
 
 3. ANTI-REPETITION RULE
    ├─ You have already said these {len(state_manager.recent_responses)} recent responses:
-   ├─ {chr(10).join([f'   "{r[:60]}..."' if len(r) > 60 else f'   "{r}"' for r in state_manager.recent_responses[-3:] if r])}
+   ├─ {chr(10).join(f'   "{p}"' for p in state_manager.get_recent_previews(3) if p)}
    ├─ NEVER use the same excuse, phrase, or specific deflection twice
    ├─ If you said "the link is loading" → next time say "my screen just went black"
    ├─ If you said "OTP didn't come" → next time say "I'm not seeing any SMS"
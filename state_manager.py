@@ -17,10 +17,16 @@ The state manager maintains a living chronicle of:
 """
 
 import re
+import sys
 import random
-from typing import List, Dict, Set, Optional, Tuple
+from collections import Counter, deque
+from collections.abc import Mapping
+from itertools import islice
+from types import MappingProxyType
+from typing import AbstractSet, Any, Callable, List, Dict, FrozenSet, NamedTuple, Set, Optional, Tuple
 from datetime import datetime
-from enum import Enum
+from functools import lru_cache
+from enum import Enum, IntFlag, auto
 
 
 class EmotionalState(str, Enum):
@@ -31,6 +37,19 @@ class EmotionalState(str, Enum):
     SUSPICION = "suspicion"                # Turns 11+: are you really from bank?
 
 
+# Display labels for each emotional state ("high_anxiety" -> "High Anxiety")
+EMOTION_LABELS: Dict[EmotionalState, str] = {
+    e: e.value.replace('_', ' ').title() for e in EmotionalState
+}
+
+# Emotional state for turns 0-10, indexed by turn_count; SUSPICION afterwards
+_EMOTION_BY_TURN: Tuple[EmotionalState, ...] = (
+    (EmotionalState.HIGH_ANXIETY,) * 4
+    + (EmotionalState.TECHNICAL_CONFUSION,) * 4
+    + (EmotionalState.FRUSTRATION,) * 3
+)
+
+
 class ConversationTopic(str, Enum):
     """Detected conversation topics"""
     OTP = "otp"
@@ -45,33 +64,537 @@ class ConversationTopic(str, Enum):
     UNKNOWN = "unknown"
 
 
+class TopicFlag(IntFlag):
+    """Bitfield form of ConversationTopic, so a set of topics is a single int"""
+    NONE = 0
+    OTP = auto()
+    UPI = auto()
+    BANK_ACCOUNT = auto()
+    LINK = auto()
+    PHONE = auto()
+    CASE_NUMBER = auto()
+    THREAT = auto()
+    VERIFICATION = auto()
+    PAYMENT = auto()
+    UNKNOWN = auto()
+
+
+# ConversationTopic value -> TopicFlag bit
+TOPIC_FLAGS: Dict[str, TopicFlag] = {t.value: TopicFlag[t.name] for t in ConversationTopic}
+
+
+def topic_names(flags: TopicFlag) -> List[str]:
+    """Expand a TopicFlag bitfield back into ConversationTopic values"""
+    return [value for value, bit in TOPIC_FLAGS.items() if flags & bit]
+
+
+class Tactic(NamedTuple):
+    """A stalling tactic that was used: its rotation category and text"""
+    category: str
+    text: str
+
+
+# Interned topic names, looked up once instead of via ConversationTopic.X.value
+# on every call. Fact types share the spelling of their topic.
+_T_OTP = sys.intern(ConversationTopic.OTP.value)
+_T_UPI = sys.intern(ConversationTopic.UPI.value)
+_T_BANK_ACCOUNT = sys.intern(ConversationTopic.BANK_ACCOUNT.value)
+_T_LINK = sys.intern(ConversationTopic.LINK.value)
+_T_PHONE = sys.intern(ConversationTopic.PHONE.value)
+_T_CASE_NUMBER = sys.intern(ConversationTopic.CASE_NUMBER.value)
+_T_THREAT = sys.intern(ConversationTopic.THREAT.value)
+_T_VERIFICATION = sys.intern(ConversationTopic.VERIFICATION.value)
+_T_PAYMENT = sys.intern(ConversationTopic.PAYMENT.value)
+_T_UNKNOWN = sys.intern(ConversationTopic.UNKNOWN.value)
+
+
+# =========================
+# Precompiled patterns
+# =========================
+# Topic detection (_detect_topics), fused into one case-insensitive scan.
+# Several topic patterns contain ".*" and overlap each other ("account number"
+# is both bank_account and phone), so each alternative is a zero-width
+# lookahead: every position is tested and no match consumes text another
+# topic needs. The group name is the ConversationTopic value.
+_TOPIC_SOURCES: Tuple[Tuple[str, str], ...] = (
+    (_T_OTP, r"\botp\b|\bone.*time.*pass\b|\bcode\b"),
+    (_T_UPI, r"\bupi\b|\bverifyi.*amount\b"),
+    (_T_BANK_ACCOUNT, r"\baccount.*number\b|\bbank.*account\b|\b账户\b"),
+    (_T_LINK, r"https?://|\.com|website|link"),
+    (_T_PHONE, r"\bphone\b|\bnumber\b|\bcall.*back\b"),
+    (_T_CASE_NUMBER, r"\bcase.*number\b|\breference.*number\b|\bref\.\b"),
+    (_T_THREAT, r"\bthreat\b|\bblock\b|\bfrozen\b|\barrest\b|\bpolice\b"),
+    (_T_PAYMENT, r"\bpay\b|\btransfer\b|\bfee\b|\bfine\b|\bamount\b"),
+    (_T_VERIFICATION, r"\bverif\b|\bconfirm\b|\bidentif\b"),
+)
+_TOPIC_RE = re.compile(
+    "|".join(f"(?=(?P<{topic}>{pattern}))" for topic, pattern in _TOPIC_SOURCES),
+    re.IGNORECASE,
+)
+# Group index -> interned topic name (m.lastgroup would hand back the
+# pattern's own, non-interned copy of the name)
+_TOPIC_BY_INDEX: Dict[int, str] = {index: sys.intern(name) for name, index in _TOPIC_RE.groupindex.items()}
+
+# Fact extraction (_extract_facts_from_message)
+_UPI_RE = re.compile(r"\b([a-zA-Z0-9._-]+@(?:ybl|paytm|okaxis|okhdfcbank|oksbi|upi|apl|axl|ibl|sbi|icici|hdfc))\b", re.IGNORECASE)
+# Catch-all: any word@word that isn't a standard email domain
+_UPI_CATCHALL_RE = re.compile(r"\b([a-zA-Z0-9._-]+@(?!(?:gmail|yahoo|hotmail|outlook|rediffmail|protonmail|mail|email|live|aol|icloud|zoho|yandex)\b)[a-zA-Z0-9_-]+)\b(?!\.(?:com|in|org|net|co|edu|gov))", re.IGNORECASE)
+_PHONE_RE = re.compile(r"(\+91[\s-]?\d{10}|\b[6-9]\d{9}\b)")
+_ACCOUNT_RE = re.compile(r"\b\d{9,18}\b")
+_LINK_RE = re.compile(r"(https?://[^\s<>\"]+|www\.[^\s<>\"]+)")
+_CASE_RE = re.compile(r"\b(?:case|ref)[.:]?\s*([A-Z0-9\-/]+)\b", re.IGNORECASE)
+# Every phone and account pattern needs a run of at least nine digits
+_DIGIT_RUN_RE = re.compile(r"\d{9}")
+
+# Structural skeleton features (extract_response_skeleton), fused into one
+# alternation so a response is scanned once; each match reports its feature
+# via the named group. No feature's match may consume another feature's only
+# trigger, hence the lookaheads in "will it (?=lock...)" and "where do (?=i)",
+# which leave the word for fear_lock / panic / compliance.
+_SKELETON_FEATURES: Tuple[Tuple[str, str], ...] = (
+    # references specific data (numbers like 3210, 3456, phone, account)
+    ('data_ref', r'\b(?:ending|number)\s+\d{3,}|\d{4,}|\+91'),
+    # "what if" hypothetical worry
+    ('what_if', r'what if|what happens if|will it (?=lock|block|freeze)|accidentally'),
+    # fear of lock/block/freeze
+    ('fear_lock', r'lock(?:ed)?\b|block(?:ed)?\b|freez|permanently|instantly'),
+    # emotional panic opener (handles both "I'm" and "I am" contractions)
+    ('panic', r"i(?:'m|\s+am)\s+(?:so\s+)?(?:panicking|anxious|worried|scared|getting anxious|really scared|really worried)"),
+    # UI/process confusion question
+    ('confusion', r'which (?:one|button|field|page)|where (?:on|exactly|do (?=i))|dropdown|checkbox|QR code'),
+    # skeptical/doubt question
+    ('skeptical', r'how do i know|why do you need|are you really|can you prove|verify this'),
+    # slow compliance ("I'm trying", "I'm typing", "I am trying")
+    ('compliance', r"i(?:'m|\s+am)\s+(?:trying|typing|doing|entering|looking|checking|opening|calling)"),
+    # asking to confirm/repeat data
+    ('confirm_req', r'can you confirm|right\??|correct\??|repeat|is (?:it|that) the (?:same|correct)'),
+)
+_SKELETON_RE = re.compile(
+    "|".join(f"(?P<{flag}>{pattern})" for flag, pattern in _SKELETON_FEATURES),
+    re.IGNORECASE,
+)
+# One bit per skeleton feature, so skeleton overlap is int & / | plus bit_count()
+_SKELETON_BITS: Dict[str, int] = {flag: 1 << i for i, (flag, _) in enumerate(_SKELETON_FEATURES)}
+
+# Data-echo keys (should_echo_data & co.): values compared without separators
+_CLEAN_RE = re.compile(r'[\s\-+]')
+
+# Comparison normalization (_normalize_for_comparison)
+_FILLER_WORDS_RE = re.compile(r"\b(?:i|me|my|the|a|an|is|are|was|were|been|be|have|has|do|does|did)\b")
+
+_UNKNOWN_TOPICS: FrozenSet[str] = frozenset({_T_UNKNOWN})
+
+
+# =========================
+# Memoized text analysis
+# =========================
+# Pure functions of their input, shared by all sessions. The same scammer
+# message or candidate reply is typically analysed several times per turn.
+@lru_cache(maxsize=512)
+def _detect_topics_cached(message: str) -> FrozenSet[str]:
+    topics = frozenset(_TOPIC_BY_INDEX[m.lastindex] for m in _TOPIC_RE.finditer(message))
+    return topics or _UNKNOWN_TOPICS
+
+
+@lru_cache(maxsize=128)
+def _topic_flags_cached(topics: FrozenSet[str]) -> TopicFlag:
+    flags = TopicFlag.NONE
+    for topic in topics:
+        flags |= TOPIC_FLAGS[topic]
+    return flags
+
+
+@lru_cache(maxsize=512)
+def _response_skeleton_cached(response: str) -> FrozenSet[str]:
+    return frozenset(m.lastgroup for m in _SKELETON_RE.finditer(response))
+
+
+@lru_cache(maxsize=512)
+def _skeleton_mask_cached(skeleton: FrozenSet[str]) -> int:
+    mask = 0
+    for feature in skeleton:
+        mask |= _SKELETON_BITS[feature]
+    return mask
+
+
+@lru_cache(maxsize=256)
+def _clean_data_value_cached(value: str) -> str:
+    # Data values (UPI IDs, phone/account numbers) recur every turn of a session
+    return _CLEAN_RE.sub('', value)
+
+
+@lru_cache(maxsize=256)
+def _short_data_reference_cached(clean: str) -> Optional[str]:
+    # Partial reference used after a value's first mention; None if too short
+    if len(clean) >= 8:
+        return f"...{clean[-4:]}"
+    elif len(clean) >= 4:
+        return f"ending {clean[-4:]}"
+    return None
+
+
+@lru_cache(maxsize=512)
+def _normalize_for_comparison_cached(text: str) -> str:
+    # Remove pronouns, articles, common filler words; split()/join() then
+    # collapses and trims whitespace without a second regex pass
+    return " ".join(_FILLER_WORDS_RE.sub("", text.lower()).split())
+
+# How many response fingerprints a session remembers for exact-repeat checks
+_MAX_RESPONSE_PATTERNS = 256
+
+# How many used tactics a session remembers (older ones may be reused)
+_MAX_USED_TACTICS = 64
+
+# Placeholder shown in prompts when a state field is still empty
+_NONE_YET = "None yet"
+
+# Fact types the honeypot tries to collect, in the order they are reported
+REQUIRED_FACT_TYPES: Tuple[str, ...] = (_T_UPI, _T_BANK_ACCOUNT, _T_PHONE, _T_LINK, _T_CASE_NUMBER)
+
+
+# =========================
+# Response templates
+# =========================
+# Acknowledgment prefixes for get_varied_ack_prefix; {v} is the fact value,
+# {last4} its last four characters.
+_ACK_PREFIX_TEMPLATES: Dict[str, Tuple[str, ...]] = {
+    "link": (
+        "I tried opening {v}, but",
+        "That {v} site is",
+        "About that website you sent,",
+        "I went to {v} and",
+        "The page at {v}",
+        "So I clicked your link and",
+    ),
+    "phone": (
+        "I noted the number {last4},",
+        "About that number ending {last4},",
+        "I tried calling {last4} but",
+        "That number you gave,",
+        "So the number ending {last4},",
+    ),
+    "upi": (
+        "I typed {v} but",
+        "About that UPI {v},",
+        "I'm entering {v} and",
+        "That ID {v}",
+        "So {v} is showing",
+        "Wait, is it exactly {v}?",
+    ),
+    "bank_account": (
+        "About account {last4},",
+        "I wrote down ...{last4},",
+        "That account ending {last4},",
+        "Wait, the account {v},",
+    ),
+}
+
+
+# System-prompt guidance for get_emotional_context
+_EMOTIONAL_CONTEXTS: Dict[EmotionalState, str] = {
+    EmotionalState.HIGH_ANXIETY: (
+        "You are PANICKED and ANXIOUS. Answer quickly, comply readily, "
+        "but show confusion about technical details. "
+        "Use reactions like 'What do I do...', 'I can't lose my savings...', 'I'm trying, I'm trying...'. "
+        "NEVER say 'Oh no' or 'My God, this is too much'. "
+        "Use periods and commas, NOT exclamation marks. Sound breathless, not theatrical."
+    ),
+    EmotionalState.TECHNICAL_CONFUSION: (
+        "You are CONFUSED and FRUSTRATED with technology. "
+        "Say things like 'my app won't load', 'I don't understand this', "
+        "'why is this happening?'. Still cooperative but showing strain."
+    ),
+    EmotionalState.FRUSTRATION: (
+        "You are FRUSTRATED and IMPATIENT. "
+        "Say 'Why is this taking so long?', 'This doesn't make sense', "
+        "'Can you explain this better?'. Still comply but more questioning."
+    ),
+    EmotionalState.SUSPICION: (
+        "You are SUSPICIOUS. Start asking 'Are you really from the bank?', "
+        "'Why won't you give me the official number?', 'This seems weird'. "
+        "Still engage but probe for contradictions."
+    ),
+}
+
+# Sentence openers for acknowledge_active_topic, keyed by topic
+_TOPIC_ACKNOWLEDGEMENTS: Dict[str, str] = {
+    _T_OTP: "I still don't see the OTP. ",
+    _T_UPI: "About the UPI ID... ",
+    _T_BANK_ACCOUNT: "Wait, about my account... ",
+    _T_LINK: "That link you mentioned... ",
+    _T_PHONE: "So that phone number... ",
+    _T_CASE_NUMBER: "Can you repeat the case number...? ",
+    _T_THREAT: "I'm really worried about this block. ",
+    _T_PAYMENT: "About the payment you mentioned... ",
+}
+
+
+# Validation questions for get_fact_validation_question; {v} is the fact value
+_VALIDATION_QUESTION_TEMPLATES: Dict[str, Tuple[str, ...]] = {
+    _T_UPI: (
+        "Is {v} spelled with a dot or a dash? I want to type it correctly.",
+        "Wait, {v} — is that the same as my bank UPI? I have a @ybl one.",
+        "I'm typing {v} but my app shows 'user not found'. Can you spell it again slowly?",
+        "So {v} — do I send money to this or is this for receiving? I'm confused.",
+        "Is {v} your personal ID or the bank's official verification ID?",
+    ),
+    _T_PHONE: (
+        "Is {v} a landline or mobile? It's showing busy on my side.",
+        "I tried {v} but it says 'number not reachable'. Is there an extension?",
+        "Can you confirm — {v} — is this your direct line or the helpdesk?",
+    ),
+    _T_LINK: (
+        "That link is showing a certificate error. Is it http or https?",
+        "The page loaded but it's asking for my mother's maiden name. Is that normal?",
+        "It opened but there's no SBI logo on the page. Are you sure this is official?",
+    ),
+    _T_BANK_ACCOUNT: (
+        "You said {v} — that doesn't match my passbook. Can you read back what you have for me?",
+        "Wait, {v} has too many digits. My account is shorter. Which bank is this?",
+        "I entered {v} but it says 'invalid account'. Can you confirm the last 4 digits?",
+    ),
+}
+
+# Baits for get_strategic_bait, keyed by the missing fact they fish for
+_STRATEGIC_BAITS: Dict[str, Tuple[str, ...]] = {
+    _T_UPI: (
+        "Wait, the OTP I see says 'BANK-123', is that the right code?",
+        "I see a message from HDFC-SECURE, but my account is SBI. Is that correct?",
+        "My nephew says I should pay through Google Pay. Do you have a UPI ID I can use?",
+        "Can I just do the verification through UPI? What ID should I enter?",
+        "I was about to transfer, but which UPI handle do I send to? My app is asking.",
+        "My son set up PhonePe for me. Can I use that? What UPI ID do I enter?",
+    ),
+    _T_LINK: (
+        "Can you send me an official website link so I can verify? I don't trust phone calls alone.",
+        "My son told me to always check the official website first. What is the URL?",
+        "Can you email me the notice? I need something in writing.",
+        "Is there a portal I can log into and check myself?",
+    ),
+    _T_PHONE: (
+        "Can you give me a callback number? I want to call from my landline.",
+        "What is the direct number for your department? I need to note it down.",
+        "My son wants to call you back and verify. What number should he dial?",
+    ),
+    _T_BANK_ACCOUNT: (
+        "If I need to make any payment, which account should I transfer to?",
+        "Can you confirm the account number? I want to cross-check with my passbook.",
+        "I'll go to the bank branch tomorrow. What account number should I mention?",
+    ),
+}
+
+# Order get_strategic_bait fishes in; UPI first since it's most commonly missed
+_BAIT_PRIORITY: Tuple[str, ...] = (_T_UPI, _T_LINK, _T_BANK_ACCOUNT, _T_PHONE)
+
+# Deliberately wrong details for get_false_info_bait
+_FALSE_INFO_BAITS: Tuple[str, ...] = (
+    "Wait, the OTP I see is 'BANK-123', is that the one?",
+    "I see a code but it's only 4 digits — 8291. Is that right or should it be 6?",
+    "The message says 'Dear HDFC customer' but I have SBI. Is this correct?",
+    "I got a notification from 'RBI-ALERT' but you said this is the bank. Which one is it?",
+    "The link opens a page with 'ICICI' logo but you mentioned SBI earlier. Is this right?",
+    "I'm seeing a reference number 'TXN-00000' on my screen. Does that match your records?",
+)
+
+# Annoyed lines for get_sentiment_shift (after turn 7)
+_ANNOYANCES: Tuple[str, ...] = (
+    "I'm trying my best, stop shouting at me!",
+    "Why is this taking so long? Getting tired of this.",
+    "I'm doing everything! Stop being aggressive!",
+    "Explain this calmly, you're stressing me out!",
+    "I appreciate if you slow down. I'm TRYING, okay?",
+)
+
+# Mirror-and-verify replies; {v} is the fact value, {last4} its last four characters
+_MIRROR_TEMPLATES: Dict[str, Tuple[str, ...]] = {
+    _T_UPI: (
+        "You said the ID is {v}, right? I typed it in, but it's showing a different name. Is that correct?",
+        "Wait, is it {v} or did you say something else? My phone autocorrected it.",
+        "I entered {v} but it's showing the name 'Rahul Enterprises.' Is that the correct official name?",
+        "Hold on, {v} — is the '@' part right? My keyboard keeps adding a dot instead.",
+        "So {v}... I typed it but it says 'beneficiary not found.' Can you spell it one more time?",
+    ),
+    _T_PHONE: (
+        "You said the number is {v}, right? I'm getting a 'not reachable' message.",
+        "Wait, {v}... is that with +91 or without? It's dialing but nobody picks up.",
+        "I wrote down {v} but my caller ID shows it as a 'Private Number.' Is that normal?",
+        "Let me confirm, {v}... the last 4 digits are {last4}, right? I want to make sure.",
+    ),
+    _T_LINK: (
+        "You said to open {v}, right? It's loading but the padlock icon is missing. Is it safe?",
+        "Wait, {v} — is it .com or .in at the end? My browser is showing a warning.",
+        "I went to {v} but it doesn't have the bank logo on top. Are you sure this is correct?",
+        "So {v}... it opened but the name in the address bar looks different. Is this the official site?",
+    ),
+    _T_BANK_ACCOUNT: (
+        "You said {v}, right? That's a long number, let me read it back to you to confirm.",
+        "Wait, {v}... I wrote it on paper but one digit might be wrong. Can you repeat slowly?",
+        "I have {v} but that doesn't match the account number on my passbook. Is this yours or mine?",
+    ),
+}
+
+# Stalling tactics for get_next_tactic, by rotation category
+_TACTICS: Dict[str, Tuple[str, ...]] = {
+    "confusion": (
+        "Where exactly on the page is the button you mentioned?",
+        "I see two fields here, which one is for the OTP?",
+        "The app is asking for something called 'VPA.' What is that?",
+        "There's a dropdown menu, which option do I select?",
+        "The page just refreshed. Where do I go now?",
+        "I see a green and a red button. Which one is proceed?",
+        "It's asking for a 4-digit PIN but you said 6-digit. Which is it?",
+    ),
+    "skeptical": (
+        "Why does a bank need my UPI PIN? My son said banks never ask for that.",
+        "Why can't I just go to the branch and do this in person?",
+        "My neighbor got a call like this and it was fraud. How do I know you're real?",
+        "Why isn't this on the official bank app? I don't see any alert there.",
+        "If this is really the bank, why are you calling from a mobile number?",
+        "Why do you need my OTP? The SMS says 'do not share with anyone.'",
+        "Can you tell me my account balance? If you're from the bank, you should know.",
+    ),
+    "slow_compliance": (
+        "I'm looking for my reading glasses, give me a minute.",
+        "I'm typing it now but my fingers are slow, please hold on.",
+        "Let me find a pen and paper first, I need to write this down.",
+        "Wait, I need to put on my glasses, everything is blurry.",
+        "I'm moving to another room, the signal is better there. One moment.",
+        "My phone is old and slow, the app is still loading. Please wait.",
+        "I'm trying, but the keyboard keeps disappearing. Give me a second, I think I'm hitting the wrong button.",
+    ),
+}
+
+# Rotation categories, and the categories allowed after each one
+_TACTIC_CATEGORIES: Tuple[str, ...] = tuple(_TACTICS)
+_NEXT_TACTIC_CATEGORIES: Dict[str, Tuple[str, ...]] = {
+    last: tuple(c for c in _TACTIC_CATEGORIES if c != last) for last in _TACTIC_CATEGORIES
+}
+
+# Excuses for get_unique_physical_excuse
+_PHYSICAL_EXCUSES: Tuple[str, ...] = (
+    "I dropped my phone in the kitchen sink, let me dry it off...",
+    "My screen is flickering, I can't see the numbers clearly...",
+    "The power just went out, I'm looking for the torch...",
+    "My reading glasses broke yesterday, I'm squinting at the screen...",
+    "I spilled tea on the keyboard, the keys are sticky now...",
+    "My grandchild grabbed the phone, one moment...",
+    "The phone fell between the sofa cushions, hold on...",
+    "My internet just disconnected, I'm restarting the router...",
+    "The battery is at 2 percent, running to get the charger...",
+    "My fingers are trembling, I keep pressing the wrong buttons...",
+    "The screen cracked again, I can barely tap on anything...",
+    "My neighbor is ringing the doorbell, one second...",
+    "The dog knocked the phone off the table, sorry...",
+    "I'm getting a headache from staring at this tiny screen...",
+    "My touchscreen is frozen, let me restart the phone...",
+    "The phone is overheating and the screen went black...",
+    "I accidentally pressed the wrong button and the app closed...",
+    "The ceiling fan wire touched my phone charger and it sparked...",
+    "I'm in the kitchen and there's too much noise, moving to another room...",
+    "My hand is cramping from holding the phone, give me a moment...",
+)
+
+# UI-confusion stalls for get_process_confusion_stall
+_PROCESS_CONFUSION_STALLS: Tuple[str, ...] = (
+    "Where exactly on the page is the button? I see three different ones.",
+    "I see two fields, which one is for the OTP?",
+    "The app is asking for a 'VPA' — is that the same as the ID you gave?",
+    "There's a dropdown with 10 banks. Which one do I pick?",
+    "It's asking for 'beneficiary name.' What do I put there?",
+    "I see 'IFSC code' and 'MICR code.' Which one do you need?",
+    "The page has a 'Forgot Password' and a 'Verify' button. Which one?",
+    "It says 'Enter registered mobile number.' Is that the one you called me on?",
+    "There's a checkbox that says 'I agree to terms.' Should I tick it first?",
+    "The app is showing me a QR code now. Do I scan it or ignore it?",
+    "I see 'NEFT', 'RTGS', and 'IMPS.' Which one is it?",
+    "Wait, it's asking me to choose 'Savings' or 'Current'. Which one?",
+    "The confirm button is greyed out. It won't let me click.",
+    "I typed the ID but it's showing a red error saying 'invalid format.' What format?",
+    "The page refreshed and now I'm back on the login screen. What happened?",
+    "There's a captcha image and I can't read what it says. Can you help?",
+    "It's asking for a 4-digit PIN, but I thought you said 6-digit OTP?",
+    "I see 'Transaction Password' and 'Login Password.' They're different?",
+)
+
+# Physical delay excuses for get_bumbling_delay
+_BUMBLING_DELAYS: Tuple[str, ...] = (
+    "I dropped my card under the sofa, let me get a flashlight...",
+    "My touch screen is acting up, let me wipe it...",
+    "The phone line is crackling, hold on...",
+    "My glasses are foggy, can't read the screen, one second...",
+    "My hands are shaking, speak slower so I can type...",
+    "The keyboard keys are sticking, wait...",
+    "The lights went out, looking for a torch...",
+    "My phone is overheating and closing apps...",
+)
+
+# Replies get_diversity_replacement draws from, by the feature they avoid
+_DIVERSITY_SKEPTICAL: Tuple[str, ...] = (
+    "Wait, my neighbor got a similar call and it was fraud. How do I know you're actually from the bank?",
+    "I just read online that banks never ask for OTP on phone. Can you give me your employee ID to verify?",
+    "Why can't I just visit the branch tomorrow and sort this out in person?",
+    "The SMS says 'Do not share OTP with anyone.' If you're from the bank, why are you asking for it?",
+    "My son is a software engineer, he says I should ask for your badge number. What is it?",
+)
+
+_DIVERSITY_COMPLIANCE: Tuple[str, ...] = (
+    "Okay, I'm opening the app now. Give me a moment, it's updating.",
+    "I found the section you mentioned. There's a form here — which field do I fill first?",
+    "Alright, I'm on the bank page now. It's asking for my customer ID. Where do I find that?",
+)
+
+_DIVERSITY_FALLBACK: Tuple[str, ...] = (
+    "Hold on, the page just refreshed. Now I see a completely different screen. What do I click?",
+    "Wait, I think I made an error somewhere. Can you start the instructions again from the beginning?",
+    "My phone just showed a security warning. Should I ignore it or is it part of the process?",
+)
+
+
 class DynamicStateManager:
     """
     Manages conversation state to ensure dynamic, human-like responses.
     Prevents bot from sounding scripted or repetitive.
     """
 
+    __slots__ = (
+        "session_id", "extracted_facts", "_facts_by_type", "asked_for",
+        "received_fact_types", "_missing_facts", "max_recent_responses",
+        "recent_responses", "response_patterns", "_response_pattern_order",
+        "_recent_previews", "_recent_word_sets", "active_topics", "_active_topics_str",
+        "previous_topics", "recent_questions", "scammer_answers_to_questions",
+        "used_openers", "forbidden_opener_phrases", "detected_contradictions",
+        "used_ack_phrases", "validated_facts", "poisoned_data_given",
+        "data_echo_counts", "max_data_echo", "used_physical_excuses",
+        "_physical_excuse_pool", "_bumbling_queue", "used_fallback_responses",
+        "used_process_confusions", "_process_confusion_pool", "mirrored_data_points",
+        "used_tactics", "_used_tactic_texts", "last_tactic_category",
+        "recent_skeletons", "_recent_skeleton_masks", "consecutive_monotone_count",
+        "_current_emotion", "_emotion_value", "_emotion_label", "emotion_history",
+        "turn_count", "last_update", "_context_snapshot",
+    )
+
     def __init__(self, session_id: str):
-        self.session_id = session_id
+        # Containers are allocated once here; reset() gives every field its
+        # per-session starting value, so reset(session_id) and a fresh
+        # DynamicStateManager(session_id) always agree.
         
         # Track extracted facts and when they were extracted
         self.extracted_facts: Dict[str, Tuple[str, int]] = {}  # fact -> (value, turn_number)
+        self._facts_by_type: Dict[str, List[str]] = {}  # fact_type -> [values], kept in sync with extracted_facts
         
         # Track what we've asked for and received
-        self.asked_for: Set[str] = set()  # {otp, upi, bank_account, phone, case_number, etc}
         self.received_fact_types: Set[str] = set()  # {upi, phone, account, link, etc}
         
         # Track generated responses to prevent repetition
-        self.recent_responses: List[str] = []  # Last 6 full responses
-        self.response_patterns: Set[str] = set()  # Normalized response beginnings
         self.max_recent_responses = 6
-        
-        # Track topics mentioned
-        self.active_topics: Set[str] = set()  # Currently relevant topics
-        self.previous_topics: Set[str] = set()  # Topics we've moved away from
+        self.recent_responses: deque = deque(maxlen=self.max_recent_responses)  # Last 6 full responses
+        self.response_patterns: Set[int] = set()  # hash() of normalized response beginnings
+        self._response_pattern_order: deque = deque()  # insertion order, for evicting the oldest fingerprint
+        self._recent_previews: deque = deque(maxlen=self.max_recent_responses)  # recent_responses truncated to 60 chars
+        self._recent_word_sets: deque = deque(maxlen=self.max_recent_responses)  # lowercased word sets of recent_responses
         
         # Track questions and answers
-        self.recent_questions: List[str] = []  # Questions we've asked
+        self.recent_questions: deque = deque(maxlen=5)  # Questions we've asked
         self.scammer_answers_to_questions: Dict[str, str] = {}  # question -> answer
         
         # NEW: Track forbidden openers (prevent repetition of emotional phrases)
@@ -82,7 +605,7 @@ class DynamicStateManager:
         self.detected_contradictions: List[Dict] = []  # [{turn, contradiction, response}]
         
         # NEW: Track acknowledgment prefixes to prevent Echo Loop
-        self.used_ack_phrases: List[str] = []  # ["I opened secure-sbi-login.com", ...]
+        self.used_ack_phrases: Set[str] = set()  # {"I opened secure-sbi-login.com", ...}
         
         # NEW: Track which scammer-provided data has been validated/engaged with
         self.validated_facts: Set[str] = set()  # {"scammer.fraud@fakebank", "+919876543210", ...}
@@ -96,33 +619,96 @@ class DynamicStateManager:
         
         # NEW: Track used physical excuses to prevent repetition
         self.used_physical_excuses: Set[str] = set()
+        self._physical_excuse_pool: List[str] = []  # not yet used this cycle
+        
+        # Shuffled get_bumbling_delay excuses, rotated after each use
+        self._bumbling_queue: deque = deque()
         
         # NEW: Track used fallback responses to prevent exact-repeat in fallback path
         self.used_fallback_responses: Set[str] = set()
         
         # FIX BLOCK 1: Logical Barrier — process confusion stalls (replaces catastrophe excuses)
         self.used_process_confusions: Set[str] = set()
+        self._process_confusion_pool: List[str] = []  # not yet used this cycle
         
         # FIX BLOCK 2: Mirror & Verify — track which data points have been mirrored back
         self.mirrored_data_points: Set[str] = set()  # data values already mirrored with doubt
         
         # FIX BLOCK 3: State Persistence — Used_Tactics list with category rotation
         # Categories: "confusion", "skeptical", "slow_compliance"
-        self.used_tactics: List[Dict[str, str]] = []  # [{"category": "confusion", "text": "I don't see the OTP"}]
-        self.last_tactic_category: Optional[str] = None  # last category used
+        self.used_tactics: deque = deque(maxlen=_MAX_USED_TACTICS)  # [Tactic("confusion", "I don't see the OTP")]
+        self._used_tactic_texts: Counter = Counter()  # lowercased used_tactics text -> occurrences
         
         # FIX BLOCK 4: Response Diversity — structural skeleton tracking
         # Each skeleton is a frozenset of feature flags like {"data_ref", "what_if", "fear_lock"}
-        self.recent_skeletons: List[frozenset] = []  # last 4 response skeletons
+        self.recent_skeletons: deque = deque(maxlen=4)  # last 4 response skeletons
+        self._recent_skeleton_masks: deque = deque(maxlen=2)  # last 2 skeletons as _SKELETON_BITS masks, all the monotony checks read
+        
+        # Emotional progression
+        self.emotion_history: List[Tuple[int, EmotionalState]] = []
+        
+        self.reset(session_id)
+
+    # =========================
+    # Session Reset
+    # =========================
+    def reset(self, session_id: str) -> None:
+        """Return to the just-constructed state for session_id, clearing containers in place"""
+        self.session_id = session_id
+        
+        self.extracted_facts.clear()
+        self._facts_by_type.clear()
+        
+        self.asked_for: TopicFlag = TopicFlag.NONE  # OTP | UPI | BANK_ACCOUNT | PHONE | CASE_NUMBER ...
+        self.received_fact_types.clear()
+        self._missing_facts: Optional[List[str]] = None  # cached get_missing_facts(), reset by update_turn
+        
+        self.recent_responses.clear()
+        self.response_patterns.clear()
+        self._response_pattern_order.clear()
+        self._recent_previews.clear()
+        self._recent_word_sets.clear()
+        
+        # Track topics mentioned
+        self.active_topics: TopicFlag = TopicFlag.NONE  # Currently relevant topics
+        self._active_topics_str: str = ""  # sorted, comma-joined active_topics for prompts
+        self.previous_topics: TopicFlag = TopicFlag.NONE  # Topics we've moved away from
+        
+        self.recent_questions.clear()
+        self.scammer_answers_to_questions.clear()
+        self.used_openers.clear()
+        self.detected_contradictions.clear()
+        self.used_ack_phrases.clear()
+        self.validated_facts.clear()
+        self.poisoned_data_given.clear()
+        self.data_echo_counts.clear()
+        self.used_physical_excuses.clear()
+        self._physical_excuse_pool[:] = _PHYSICAL_EXCUSES
+        self._bumbling_queue.clear()
+        self._bumbling_queue.extend(random.sample(_BUMBLING_DELAYS, len(_BUMBLING_DELAYS)))
+        self.used_fallback_responses.clear()
+        self.used_process_confusions.clear()
+        self._process_confusion_pool[:] = _PROCESS_CONFUSION_STALLS
+        self.mirrored_data_points.clear()
+        
+        self.used_tactics.clear()
+        self._used_tactic_texts.clear()
+        self.last_tactic_category: Optional[str] = None  # last category used
+        self.recent_skeletons.clear()
+        self._recent_skeleton_masks.clear()
         self.consecutive_monotone_count: int = 0  # how many consecutive structurally-similar responses
         
         # Emotional progression
         self.current_emotion = EmotionalState.HIGH_ANXIETY
-        self.emotion_history: List[Tuple[int, EmotionalState]] = [(0, EmotionalState.HIGH_ANXIETY)]
+        self.emotion_history.clear()
+        self.emotion_history.append((0, EmotionalState.HIGH_ANXIETY))
         
         # Turn tracking
         self.turn_count = 0
         self.last_update = datetime.now()
+        
+        # Snapshot of get_context_for_llm(), dropped whenever update_turn mutates state
+        self._context_snapshot: Optional[str] = None
 
     # =========================
     # Core State Updates
@@ -131,6 +717,8 @@ class DynamicStateManager:
         """Update state after receiving scammer message and generating response"""
         self.turn_count += 1
         self.last_update = datetime.now()
+        self._context_snapshot = None
+        self._missing_facts = None
         
         # Track the response
         self._track_response(generated_response)
@@ -143,87 +731,91 @@ class DynamicStateManager:
         facts = self._extract_facts_from_message(scammer_message)
         for fact_type, values in facts.items():
             for value in values:
-                self.extracted_facts[value] = (fact_type, self.turn_count)
+                self._record_fact(value, fact_type)
                 self.received_fact_types.add(fact_type)
         
         # Update emotional state based on turn count
         self._progress_emotion()
 
+    def _record_fact(self, value: str, fact_type: str) -> None:
+        """Store a fact and keep the by-type index in sync"""
+        fact_type = sys.intern(fact_type)
+        previous = self.extracted_facts.get(value)
+        if previous is None:
+            self._facts_by_type.setdefault(fact_type, []).append(value)
+        elif previous[0] != fact_type:
+            # Same value re-extracted under another type: move it across
+            old_values = self._facts_by_type[previous[0]]
+            old_values.remove(value)
+            if not old_values:
+                del self._facts_by_type[previous[0]]
+            self._facts_by_type.setdefault(fact_type, []).append(value)
+        self.extracted_facts[value] = (fact_type, self.turn_count)
+
     def _track_response(self, response: str) -> None:
         """Track response to prevent repetition"""
         self.recent_responses.append(response)
-        if len(self.recent_responses) > self.max_recent_responses:
-            self.recent_responses.pop(0)
-        
-        # Store normalized pattern (first ~50 chars) for quick dedup
-        pattern = self._normalize_for_comparison(response[:80])
-        self.response_patterns.add(pattern)
+        self._recent_previews.append(response[:60] + '...' if len(response) > 60 else response)
+        self._recent_word_sets.append(frozenset(response.lower().split()))
+        
+        # Store a fingerprint of the normalized pattern (first ~80 chars) for quick dedup
+        fingerprint = hash(self._normalize_for_comparison(response[:80]))
+        if fingerprint not in self.response_patterns:
+            self.response_patterns.add(fingerprint)
+            self._response_pattern_order.append(fingerprint)
+            if len(self._response_pattern_order) > _MAX_RESPONSE_PATTERNS:
+                self.response_patterns.discard(self._response_pattern_order.popleft())
 
-    def _detect_topics(self, message: str) -> Set[str]:
+    def _detect_topics(self, message: str) -> FrozenSet[str]:
         """Detect conversation topics in message"""
-        text = message.lower()
-        topics = set()
-        
-        # Topic detection patterns
-        if re.search(r"\botp\b|\bone.*time.*pass\b|\bcode\b", text):
-            topics.add(ConversationTopic.OTP.value)
-        if re.search(r"\bupi\b|\bverifyi.*amount\b", text):
-            topics.add(ConversationTopic.UPI.value)
-        if re.search(r"\baccount.*number\b|\bbank.*account\b|\b账户\b", text):
-            topics.add(ConversationTopic.BANK_ACCOUNT.value)
-        if re.search(r"https?://|\.com|website|link", text):
-            topics.add(ConversationTopic.LINK.value)
-        if re.search(r"\bphone\b|\bnumber\b|\bcall.*back\b", text):
-            topics.add(ConversationTopic.PHONE.value)
-        if re.search(r"\bcase.*number\b|\breference.*number\b|\bref\.\b", text):
-            topics.add(ConversationTopic.CASE_NUMBER.value)
-        if re.search(r"\bthreat\b|\bblock\b|\bfrozen\b|\barrest\b|\bpolice\b", text):
-            topics.add(ConversationTopic.THREAT.value)
-        if re.search(r"\bpay\b|\btransfer\b|\bfee\b|\bfine\b|\bamount\b", text):
-            topics.add(ConversationTopic.PAYMENT.value)
-        if re.search(r"\bverif\b|\bconfirm\b|\bidentif\b", text):
-            topics.add(ConversationTopic.VERIFICATION.value)
-        
-        if not topics:
-            topics.add(ConversationTopic.UNKNOWN.value)
-        
-        return topics
-
-    def _update_active_topics(self, new_topics: Set[str]) -> None:
+        return _detect_topics_cached(message)
+
+    def _update_active_topics(self, new_topics: FrozenSet[str]) -> None:
         """Update topic tracking"""
         # If scammer introduces new topic, track it
-        if new_topics and ConversationTopic.UNKNOWN.value not in new_topics:
-            self.previous_topics.update(self.active_topics - new_topics)
-            self.active_topics = new_topics
+        if new_topics and _T_UNKNOWN not in new_topics:
+            new_flags = _topic_flags_cached(new_topics)
+            self.previous_topics |= self.active_topics & ~new_flags
+            self.active_topics = new_flags
+            self._active_topics_str = ', '.join(sorted(new_topics))
 
     def _extract_facts_from_message(self, message: str) -> Dict[str, List[str]]:
         """Extract structured facts from message"""
-        facts = {
-            "upi": list(dict.fromkeys(
-                re.findall(r"\b([a-zA-Z0-9._-]+@(?:ybl|paytm|okaxis|okhdfcbank|oksbi|upi|apl|axl|ibl|sbi|icici|hdfc))\b", message, re.IGNORECASE)
-                # Catch-all: any word@word that isn't a standard email domain
-                + re.findall(r"\b([a-zA-Z0-9._-]+@(?!(?:gmail|yahoo|hotmail|outlook|rediffmail|protonmail|mail|email|live|aol|icloud|zoho|yandex)\b)[a-zA-Z0-9_-]+)\b(?!\.(?:com|in|org|net|co|edu|gov))", message, re.IGNORECASE)
-            )),
-            "phone": re.findall(r"(\+91[\s-]?\d{10}|\b[6-9]\d{9}\b)", message),
-            "bank_account": re.findall(r"\b\d{9,18}\b", message),
-            "link": re.findall(r"(https?://[^\s<>\"]+|www\.[^\s<>\"]+)", message),
-            "case_number": re.findall(r"\b(?:case|ref)[.:]?\s*([A-Z0-9\-/]+)\b", message, re.IGNORECASE),
-        }
+        facts = {}
+        # Each pattern only runs if the cheap substring check for its
+        # required literal passes; most messages carry one fact type at most.
+        if "@" in message:
+            facts[_T_UPI] = list(dict.fromkeys(_UPI_RE.findall(message) + _UPI_CATCHALL_RE.findall(message)))
+        if _DIGIT_RUN_RE.search(message):
+            facts[_T_PHONE] = _PHONE_RE.findall(message)
+            facts[_T_BANK_ACCOUNT] = _ACCOUNT_RE.findall(message)
+        if "http" in message or "www." in message:
+            facts[_T_LINK] = _LINK_RE.findall(message)
+        folded = message.casefold()
+        if "case" in folded or "ref" in folded:
+            facts[_T_CASE_NUMBER] = _CASE_RE.findall(message)
         # Filter out empty lists
         return {k: v for k, v in facts.items() if v}
 
+    @property
+    def current_emotion(self) -> EmotionalState:
+        return self._current_emotion
+
+    @current_emotion.setter
+    def current_emotion(self, emotion: EmotionalState) -> None:
+        # Cache the string forms so per-turn summaries skip Enum.value and relabelling
+        self._current_emotion = emotion
+        self._emotion_value = emotion.value
+        self._emotion_label = EMOTION_LABELS[emotion]
+
     def _progress_emotion(self) -> None:
         """Progress emotional state based on turn count"""
-        if self.turn_count <= 3:
-            new_emotion = EmotionalState.HIGH_ANXIETY
-        elif self.turn_count <= 7:
-            new_emotion = EmotionalState.TECHNICAL_CONFUSION
-        elif self.turn_count <= 10:
-            new_emotion = EmotionalState.FRUSTRATION
+        if self.turn_count < len(_EMOTION_BY_TURN):
+            new_emotion = _EMOTION_BY_TURN[self.turn_count]
         else:
             new_emotion = EmotionalState.SUSPICION
         
-        if new_emotion != self.current_emotion:
+        if new_emotion is not self.current_emotion:
             self.current_emotion = new_emotion
             self.emotion_history.append((self.turn_count, new_emotion))
 
@@ -232,15 +824,17 @@ class DynamicStateManager:
     # =========================
     def should_avoid_response(self, candidate_response: str) -> bool:
         """Check if response is too similar to recent ones"""
-        pattern = self._normalize_for_comparison(candidate_response[:80])
+        fingerprint = hash(self._normalize_for_comparison(candidate_response[:80]))
         
         # Exact pattern match = definitely skip
-        if pattern in self.response_patterns:
+        if fingerprint in self.response_patterns:
             return True
         
         # Fuzzy match: check if candidate is very similar to recent responses
-        for recent in self.recent_responses[-3:]:
-            similarity = self._similarity_score(candidate_response, recent)
+        # (word sets of recent responses are computed once, when tracked)
+        candidate_words = set(candidate_response.lower().split())
+        for recent_words in islice(self._recent_word_sets, max(len(self._recent_word_sets) - 3, 0), None):
+            similarity = self._word_set_similarity(candidate_words, recent_words)
             if similarity > 0.75:  # 75% similar = skip
                 return True
         
@@ -248,17 +842,11 @@ class DynamicStateManager:
 
     def _normalize_for_comparison(self, text: str) -> str:
         """Normalize text for comparison"""
-        # Remove pronouns, articles, common filler words
-        normalized = re.sub(r"\b(i|me|my|the|a|an|is|are|was|were|been|be|have|has|do|does|did)\b", "", text.lower())
-        normalized = re.sub(r"\s+", " ", normalized).strip()
-        return normalized
+        return _normalize_for_comparison_cached(text)
 
-    def _similarity_score(self, text1: str, text2: str) -> float:
-        """Calculate simple similarity score between 0 and 1"""
-        # Rough Jaccard similarity on words
-        words1 = set(text1.lower().split())
-        words2 = set(text2.lower().split())
-        
+    @staticmethod
+    def _word_set_similarity(words1: AbstractSet[str], words2: AbstractSet[str]) -> float:
+        """Jaccard similarity of two pre-tokenized word sets"""
         if not words1 or not words2:
             return 0.0
         
@@ -275,44 +863,9 @@ class DynamicStateManager:
         Returns a frozenset of features present (e.g., {'data_ref', 'what_if', 'fear_lock'}).
         Two responses with the same skeleton are structurally identical even if words differ.
         """
-        text = response.lower()
-        features = set()
-        
-        # Feature: references specific data (numbers like 3210, 3456, phone, account)
-        if re.search(r'\b(?:ending|number)\s+\d{3,}|\d{4,}|\+91', text):
-            features.add('data_ref')
-        
-        # Feature: "what if" hypothetical worry
-        if re.search(r'what if|what happens if|will it (?:lock|block|freeze)|accidentally', text):
-            features.add('what_if')
-        
-        # Feature: fear of lock/block/freeze
-        if re.search(r'lock(?:ed)?\b|block(?:ed)?\b|freez|permanently|instantly', text):
-            features.add('fear_lock')
-        
-        # Feature: emotional panic opener (handles both "I'm" and "I am" contractions)
-        if re.search(r"i(?:'m|\s+am)\s+(?:so\s+)?(?:panicking|anxious|worried|scared|getting anxious|really scared|really worried)", text):
-            features.add('panic')
-        
-        # Feature: UI/process confusion question
-        if re.search(r'which (?:one|button|field|page)|where (?:on|exactly|do i)|dropdown|checkbox|QR code', text):
-            features.add('confusion')
-        
-        # Feature: skeptical/doubt question
-        if re.search(r'how do i know|why do you need|are you really|can you prove|verify this', text):
-            features.add('skeptical')
-        
-        # Feature: slow compliance ("I'm trying", "I'm typing", "I am trying")
-        if re.search(r"i(?:'m|\s+am)\s+(?:trying|typing|doing|entering|looking|checking|opening|calling)", text):
-            features.add('compliance')
-        
-        # Feature: asking to confirm/repeat data
-        if re.search(r'can you confirm|right\??|correct\??|repeat|is (?:it|that) the (?:same|correct)', text):
-            features.add('confirm_req')
-        
-        return frozenset(features)
+        return _response_skeleton_cached(response)
     
-    def is_structurally_repetitive(self, new_response: str) -> bool:
+    def is_structurally_repetitive(self, new_response: str, skeleton: Optional[FrozenSet[str]] = None) -> bool:
         """
         Check if the new response is structurally too similar to the last 2 responses.
         Uses 'common core' matching: finds features shared by the last 2 responses,
@@ -320,60 +873,66 @@ class DynamicStateManager:
         
         This catches the pattern where turns 6/7/8 all follow:
         "data_ref + fear_lock + what_if" even if one has 'panic' and another has 'confirm_req'.
+        Pass skeleton when extract_response_skeleton(new_response) is already at hand.
         """
-        new_skeleton = self.extract_response_skeleton(new_response)
-        
-        if len(self.recent_skeletons) < 2:
+        masks = self._recent_skeleton_masks
+        if len(masks) < 2:
             return False
         
-        last_two = self.recent_skeletons[-2:]
+        if skeleton is None:
+            skeleton = _response_skeleton_cached(new_response)
+        new_skeleton = _skeleton_mask_cached(skeleton)
+        prev, last = masks[-2], masks[-1]
         
         # Strategy 1: Common Core matching
         # Find features shared by the last 2 responses
-        common_core = last_two[0] & last_two[1]
-        if common_core and len(common_core) >= 2:
+        common_core = prev & last
+        if common_core.bit_count() >= 2:
             # Check how many core features the new response shares
-            new_matches_core = len(new_skeleton & common_core)
+            new_matches_core = (new_skeleton & common_core).bit_count()
             if new_matches_core >= 2:
                 return True  # New response matches the same core pattern
         
         # Strategy 2: Direct high overlap with either recent response
-        for prev_skeleton in last_two:
+        for prev_skeleton, other in ((prev, last), (last, prev)):
             if not new_skeleton or not prev_skeleton:
                 continue
-            shared = len(new_skeleton & prev_skeleton)
-            total = max(len(new_skeleton | prev_skeleton), 1)
+            shared = (new_skeleton & prev_skeleton).bit_count()
+            total = (new_skeleton | prev_skeleton).bit_count()
             if shared / total >= 0.80:
                 # Very high overlap with at least one recent response
                 # Only flag if we also have moderate overlap with the other
-                other = [s for s in last_two if s is not prev_skeleton][0]
                 if other:
-                    other_shared = len(new_skeleton & other)
-                    other_total = max(len(new_skeleton | other), 1)
+                    other_shared = (new_skeleton & other).bit_count()
+                    other_total = (new_skeleton | other).bit_count()
                     if other_shared / other_total >= 0.50:
                         return True
         
         # Strategy 3: Check if all 3 share the same dominant feature combo
         # (handles cases where each response has 1 unique feature but shares 2+ common ones)
-        three_way_intersection = new_skeleton & last_two[0] & last_two[1]
-        if len(three_way_intersection) >= 2:
+        three_way_intersection = new_skeleton & prev & last
+        if three_way_intersection.bit_count() >= 2:
             return True
         
         return False
     
-    def record_response_skeleton(self, response: str) -> None:
-        """Record the structural skeleton of a response for future comparison."""
-        skeleton = self.extract_response_skeleton(response)
+    def record_response_skeleton(self, response: str, skeleton: Optional[FrozenSet[str]] = None) -> None:
+        """
+        Record the structural skeleton of a response for future comparison.
+        Pass skeleton when extract_response_skeleton(response) is already at hand.
+        """
+        if skeleton is None:
+            skeleton = _response_skeleton_cached(response)
         self.recent_skeletons.append(skeleton)
-        if len(self.recent_skeletons) > 4:
-            self.recent_skeletons.pop(0)
+        masks = self._recent_skeleton_masks
+        masks.append(_skeleton_mask_cached(skeleton))
         
         # Track consecutive monotone count
-        if len(self.recent_skeletons) >= 2:
-            last = self.recent_skeletons[-1]
-            prev = self.recent_skeletons[-2]
-            shared = len(last & prev) if last and prev else 0
-            total = max(len(last | prev), 1) if last and prev else 1
+        if len(masks) >= 2:
+            last = masks[-1]
+            prev = masks[-2]
+            shared = (last & prev).bit_count() if last and prev else 0
+            total = (last | prev).bit_count() if last and prev else 1
             if shared / total >= 0.7:
                 self.consecutive_monotone_count += 1
             else:
@@ -389,7 +948,7 @@ class DynamicStateManager:
         if not self.recent_skeletons:
             return None
         recent_features = set()
-        for sk in self.recent_skeletons[-2:]:
+        for sk in islice(reversed(self.recent_skeletons), 2):
             recent_features.update(sk)
         
         # Pick a response type that's ABSENT from recent features
@@ -402,20 +961,10 @@ class DynamicStateManager:
                 candidates.append(stall)
         
         if 'skeptical' not in recent_features:
-            candidates.extend([
-                "Wait, my neighbor got a similar call and it was fraud. How do I know you're actually from the bank?",
-                "I just read online that banks never ask for OTP on phone. Can you give me your employee ID to verify?",
-                "Why can't I just visit the branch tomorrow and sort this out in person?",
-                "The SMS says 'Do not share OTP with anyone.' If you're from the bank, why are you asking for it?",
-                "My son is a software engineer, he says I should ask for your badge number. What is it?",
-            ])
+            candidates.extend(_DIVERSITY_SKEPTICAL)
         
         if 'compliance' not in recent_features and 'what_if' not in recent_features:
-            candidates.extend([
-                "Okay, I'm opening the app now. Give me a moment, it's updating.",
-                "I found the section you mentioned. There's a form here — which field do I fill first?",
-                "Alright, I'm on the bank page now. It's asking for my customer ID. Where do I find that?",
-            ])
+            candidates.extend(_DIVERSITY_COMPLIANCE)
         
         if not candidates:
             # Fallback: always use a process confusion stall
@@ -423,14 +972,11 @@ class DynamicStateManager:
             if stall:
                 candidates.append(stall)
             else:
-                candidates.extend([
-                    "Hold on, the page just refreshed. Now I see a completely different screen. What do I click?",
-                    "Wait, I think I made an error somewhere. Can you start the instructions again from the beginning?",
-                    "My phone just showed a security warning. Should I ignore it or is it part of the process?",
-                ])
+                candidates.extend(_DIVERSITY_FALLBACK)
         
         # Filter out recently used tactics
-        unused = [c for c in candidates if not self.was_tactic_text_used(c)]
+        used_texts = self._used_tactic_texts
+        unused = [c for c in candidates if c.lower() not in used_texts]
         if unused:
             chosen = random.choice(unused)
         else:
@@ -440,20 +986,17 @@ class DynamicStateManager:
         self.record_tactic('diversity_break', chosen)
         return chosen
 
-    def get_facts_already_provided(self) -> Dict[str, List[str]]:
-        """Return facts already extracted from scammer"""
-        result = {}
-        for value, (fact_type, turn) in self.extracted_facts.items():
-            if fact_type not in result:
-                result[fact_type] = []
-            result[fact_type].append(value)
-        return result
+    def get_facts_already_provided(self) -> Mapping[str, List[str]]:
+        """Return facts already extracted from scammer, grouped by type.
+        Read-only live view of the index kept by _record_fact."""
+        return MappingProxyType(self._facts_by_type)
 
     def get_missing_facts(self) -> List[str]:
         """Return list of facts we haven't collected yet"""
-        needed = ["upi", "bank_account", "phone", "link", "case_number"]
-        missing = [f for f in needed if f not in self.received_fact_types]
-        return missing
+        if self._missing_facts is None:
+            received = self.received_fact_types
+            self._missing_facts = [f for f in REQUIRED_FACT_TYPES if f not in received]
+        return self._missing_facts
 
     # =========================
     # Question Tracking
@@ -461,8 +1004,6 @@ class DynamicStateManager:
     def track_question_asked(self, question: str) -> None:
         """Record a question we asked"""
         self.recent_questions.append(question)
-        if len(self.recent_questions) > 5:
-            self.recent_questions.pop(0)
 
     def should_ask_for_fact(self, fact_type: str) -> bool:
         """Check if we should ask for a specific fact"""
@@ -470,7 +1011,7 @@ class DynamicStateManager:
 
     def was_question_recently_asked(self, keyword: str) -> bool:
         """Check if we recently asked about a topic"""
-        for question in self.recent_questions[-3:]:
+        for question in islice(reversed(self.recent_questions), 3):
             if keyword.lower() in question.lower():
                 return True
         return False
@@ -480,34 +1021,7 @@ class DynamicStateManager:
     # =========================
     def get_emotional_context(self) -> str:
         """Return emotional context for prompt engineering"""
-        emotion = self.current_emotion
-        
-        if emotion == EmotionalState.HIGH_ANXIETY:
-            return (
-                "You are PANICKED and ANXIOUS. Answer quickly, comply readily, "
-                "but show confusion about technical details. "
-                "Use reactions like 'What do I do...', 'I can't lose my savings...', 'I'm trying, I'm trying...'. "
-                "NEVER say 'Oh no' or 'My God, this is too much'. "
-                "Use periods and commas, NOT exclamation marks. Sound breathless, not theatrical."
-            )
-        elif emotion == EmotionalState.TECHNICAL_CONFUSION:
-            return (
-                "You are CONFUSED and FRUSTRATED with technology. "
-                "Say things like 'my app won't load', 'I don't understand this', "
-                "'why is this happening?'. Still cooperative but showing strain."
-            )
-        elif emotion == EmotionalState.FRUSTRATION:
-            return (
-                "You are FRUSTRATED and IMPATIENT. "
-                "Say 'Why is this taking so long?', 'This doesn't make sense', "
-                "'Can you explain this better?'. Still comply but more questioning."
-            )
-        else:  # SUSPICION
-            return (
-                "You are SUSPICIOUS. Start asking 'Are you really from the bank?', "
-                "'Why won't you give me the official number?', 'This seems weird'. "
-                "Still engage but probe for contradictions."
-            )
+        return _EMOTIONAL_CONTEXTS[self.current_emotion]
 
     # =========================
     # Topic Anchoring
@@ -519,30 +1033,12 @@ class DynamicStateManager:
         Returns a sentence framing for the response.
         """
         topics = self._detect_topics(scammer_message)
-        if ConversationTopic.UNKNOWN.value in topics:
+        if _T_UNKNOWN in topics:
             return None
         
         # Pick the most specific topic
-        topic = list(topics)[0] if topics else None
-        
-        if topic == ConversationTopic.OTP.value:
-            return "I still don't see the OTP. "
-        elif topic == ConversationTopic.UPI.value:
-            return "About the UPI ID... "
-        elif topic == ConversationTopic.BANK_ACCOUNT.value:
-            return "Wait, about my account... "
-        elif topic == ConversationTopic.LINK.value:
-            return "That link you mentioned... "
-        elif topic == ConversationTopic.PHONE.value:
-            return "So that phone number... "
-        elif topic == ConversationTopic.CASE_NUMBER.value:
-            return "Can you repeat the case number...? "
-        elif topic == ConversationTopic.THREAT.value:
-            return "I'm really worried about this block. "
-        elif topic == ConversationTopic.PAYMENT.value:
-            return "About the payment you mentioned... "
-        
-        return None
+        topic = next(iter(topics), None)
+        return _TOPIC_ACKNOWLEDGEMENTS.get(topic)
 
     # =========================
     # ENHANCEMENT: Defect Fixes
@@ -575,17 +1071,11 @@ class DynamicStateManager:
 
     def get_bumbling_delay(self) -> str:
         """Return a physical delay excuse instead of asking for definitions"""
-        delays = [
-            "I dropped my card under the sofa, let me get a flashlight...",
-            "My touch screen is acting up, let me wipe it...",
-            "The phone line is crackling, hold on...",
-            "My glasses are foggy, can't read the screen, one second...",
-            "My hands are shaking, speak slower so I can type...",
-            "The keyboard keys are sticking, wait...",
-            "The lights went out, looking for a torch...",
-            "My phone is overheating and closing apps...",
-        ]
-        return random.choice(delays)
+        # Round-robin over a per-session shuffle: no excuse repeats until all have been used
+        queue = self._bumbling_queue
+        delay = queue[0]
+        queue.rotate(-1)
+        return delay
 
     def get_poisoned_data(self, data_type: str) -> str:
         """Return intentionally poisoned data to force re-asks"""
@@ -610,47 +1100,12 @@ class DynamicStateManager:
         Instead of always saying 'I opened secure-sbi-login.com,' vary the phrasing each turn.
         """
         
-        link_prefixes = [
-            f"I tried opening {fact_value}, but",
-            f"That {fact_value} site is",
-            f"About that website you sent,",
-            f"I went to {fact_value} and",
-            f"The page at {fact_value}",
-            f"So I clicked your link and",
-        ]
-        
-        phone_prefixes = [
-            f"I noted the number {fact_value[-4:]},",
-            f"About that number ending {fact_value[-4:]},",
-            f"I tried calling {fact_value[-4:]} but",
-            f"That number you gave,",
-            f"So the number ending {fact_value[-4:]},",
-        ]
-        
-        upi_prefixes = [
-            f"I typed {fact_value} but",
-            f"About that UPI {fact_value},",
-            f"I'm entering {fact_value} and",
-            f"That ID {fact_value}",
-            f"So {fact_value} is showing",
-            f"Wait, is it exactly {fact_value}?",
-        ]
-        
-        account_prefixes = [
-            f"About account {fact_value[-4:]},",
-            f"I wrote down ...{fact_value[-4:]},",
-            f"That account ending {fact_value[-4:]},",
-            f"Wait, the account {fact_value},",
-        ]
-        
-        prefix_map = {
-            "link": link_prefixes,
-            "phone": phone_prefixes,
-            "upi": upi_prefixes,
-            "bank_account": account_prefixes,
-        }
-        
-        candidates = prefix_map.get(fact_type, [f"About {fact_value},"])
+        templates = _ACK_PREFIX_TEMPLATES.get(fact_type)
+        if templates is None:
+            candidates = [f"About {fact_value},"]
+        else:
+            fields = {"v": fact_value, "last4": fact_value[-4:]}
+            candidates = [t.format_map(fields) for t in templates]
         
         # Filter out already-used prefixes
         unused = [p for p in candidates if p not in self.used_ack_phrases]
@@ -659,7 +1114,7 @@ class DynamicStateManager:
             unused = candidates
         
         chosen = random.choice(unused)
-        self.used_ack_phrases.append(chosen)
+        self.used_ack_phrases.add(chosen)
         return chosen
 
     def get_fact_validation_question(self, fact_type: str, fact_value: str) -> Optional[str]:
@@ -669,49 +1124,17 @@ class DynamicStateManager:
         that keep the scammer talking AND validate the intel.
         """
         
+        fact_value = sys.intern(fact_value)  # shares its cached hash across the session's sets
         if fact_value in self.validated_facts:
             return None  # Already validated this one
         
         self.validated_facts.add(fact_value)
         
-        upi_questions = [
-            f"Is {fact_value} spelled with a dot or a dash? I want to type it correctly.",
-            f"Wait, {fact_value} — is that the same as my bank UPI? I have a @ybl one.",
-            f"I'm typing {fact_value} but my app shows 'user not found'. Can you spell it again slowly?",
-            f"So {fact_value} — do I send money to this or is this for receiving? I'm confused.",
-            f"Is {fact_value} your personal ID or the bank's official verification ID?",
-        ]
-        
-        phone_questions = [
-            f"Is {fact_value} a landline or mobile? It's showing busy on my side.",
-            f"I tried {fact_value} but it says 'number not reachable'. Is there an extension?",
-            f"Can you confirm — {fact_value} — is this your direct line or the helpdesk?",
-        ]
-        
-        link_questions = [
-            f"That link is showing a certificate error. Is it http or https?",
-            f"The page loaded but it's asking for my mother's maiden name. Is that normal?",
-            f"It opened but there's no SBI logo on the page. Are you sure this is official?",
-        ]
-        
-        account_questions = [
-            f"You said {fact_value} — that doesn't match my passbook. Can you read back what you have for me?",
-            f"Wait, {fact_value} has too many digits. My account is shorter. Which bank is this?",
-            f"I entered {fact_value} but it says 'invalid account'. Can you confirm the last 4 digits?",
-        ]
-        
-        question_map = {
-            "upi": upi_questions,
-            "phone": phone_questions,
-            "link": link_questions,
-            "bank_account": account_questions,
-        }
-        
-        candidates = question_map.get(fact_type, [])
-        if not candidates:
+        templates = _VALIDATION_QUESTION_TEMPLATES.get(fact_type)
+        if not templates:
             return None
         
-        return random.choice(candidates)
+        return random.choice(templates).format(v=fact_value)
 
     # =========================
     # ENHANCEMENT: Anti-Echo (Data Repetition Prevention)
@@ -719,35 +1142,33 @@ class DynamicStateManager:
     def should_echo_data(self, data_value: str) -> bool:
         """Check if a data point should be echoed fully (max 1 full mention).
         After first mention, use partial references only."""
-        clean = re.sub(r'[\s\-+]', '', data_value)
+        clean = _clean_data_value_cached(data_value)
         count = self.data_echo_counts.get(clean, 0)
         return count < self.max_data_echo
 
     def record_data_echo(self, data_value: str) -> None:
         """Record that a data point was echoed in a response"""
-        clean = re.sub(r'[\s\-+]', '', data_value)
+        clean = _clean_data_value_cached(data_value)
         self.data_echo_counts[clean] = self.data_echo_counts.get(clean, 0) + 1
 
     def get_data_reference(self, data_value: str) -> str:
         """Get an abbreviated reference for data after first mention.
         First time: full value. After: last 4 digits only."""
-        clean = re.sub(r'[\s\-+]', '', data_value)
-        count = self.data_echo_counts.get(clean, 0)
-        if count == 0:
+        clean = _clean_data_value_cached(data_value)
+        if not self.data_echo_counts.get(clean, 0):
             return data_value  # First mention: use full value
         # Subsequent mentions: use partial reference
-        if len(clean) >= 8:
-            return f"...{clean[-4:]}"
-        elif len(clean) >= 4:
-            return f"ending {clean[-4:]}"
-        return data_value
+        return _short_data_reference_cached(clean) or data_value
 
     def detect_data_echo_in_response(self, response: str) -> List[str]:
         """Find full data values repeated in a response that shouldn't be."""
         echoed = []
+        cleaned = None  # response without separators, built on first use
         for value, count in self.data_echo_counts.items():
             if count >= self.max_data_echo and len(value) >= 8:
-                if value in re.sub(r'[\s\-+]', '', response):
+                if cleaned is None:
+                    cleaned = _CLEAN_RE.sub('', response)
+                if value in cleaned:
                     echoed.append(value)
         return echoed
 
@@ -757,33 +1178,15 @@ class DynamicStateManager:
     def get_unique_physical_excuse(self) -> str:
         """Return a physical excuse that hasn't been used yet in this session.
         Pool of 20+ diverse excuses. Never repeats until all are exhausted."""
-        all_excuses = [
-            "I dropped my phone in the kitchen sink, let me dry it off...",
-            "My screen is flickering, I can't see the numbers clearly...",
-            "The power just went out, I'm looking for the torch...",
-            "My reading glasses broke yesterday, I'm squinting at the screen...",
-            "I spilled tea on the keyboard, the keys are sticky now...",
-            "My grandchild grabbed the phone, one moment...",
-            "The phone fell between the sofa cushions, hold on...",
-            "My internet just disconnected, I'm restarting the router...",
-            "The battery is at 2 percent, running to get the charger...",
-            "My fingers are trembling, I keep pressing the wrong buttons...",
-            "The screen cracked again, I can barely tap on anything...",
-            "My neighbor is ringing the doorbell, one second...",
-            "The dog knocked the phone off the table, sorry...",
-            "I'm getting a headache from staring at this tiny screen...",
-            "My touchscreen is frozen, let me restart the phone...",
-            "The phone is overheating and the screen went black...",
-            "I accidentally pressed the wrong button and the app closed...",
-            "The ceiling fan wire touched my phone charger and it sparked...",
-            "I'm in the kitchen and there's too much noise, moving to another room...",
-            "My hand is cramping from holding the phone, give me a moment...",
-        ]
-        unused = [e for e in all_excuses if e not in self.used_physical_excuses]
-        if not unused:
+        # Swap-remove a random entry from the remaining pool: O(1), no rescans
+        pool = self._physical_excuse_pool
+        if not pool:
             self.used_physical_excuses.clear()
-            unused = all_excuses
-        chosen = random.choice(unused)
+            pool.extend(_PHYSICAL_EXCUSES)
+        i = random.randrange(len(pool))
+        chosen = pool[i]
+        pool[i] = pool[-1]
+        pool.pop()
         self.used_physical_excuses.add(chosen)
         return chosen
 
@@ -793,70 +1196,19 @@ class DynamicStateManager:
     def get_strategic_bait(self) -> Optional[str]:
         """Generate strategic bait to push scammer into providing missing intel.
         Uses false information to force corrections and reveal infrastructure."""
-        missing = self.get_missing_facts()
-        if not missing:
-            return None
-        
-        baits = {
-            "upi": [
-                "Wait, the OTP I see says 'BANK-123', is that the right code?",
-                "I see a message from HDFC-SECURE, but my account is SBI. Is that correct?",
-                "My nephew says I should pay through Google Pay. Do you have a UPI ID I can use?",
-                "Can I just do the verification through UPI? What ID should I enter?",
-                "I was about to transfer, but which UPI handle do I send to? My app is asking.",
-                "My son set up PhonePe for me. Can I use that? What UPI ID do I enter?",
-            ],
-            "link": [
-                "Can you send me an official website link so I can verify? I don't trust phone calls alone.",
-                "My son told me to always check the official website first. What is the URL?",
-                "Can you email me the notice? I need something in writing.",
-                "Is there a portal I can log into and check myself?",
-            ],
-            "phone": [
-                "Can you give me a callback number? I want to call from my landline.",
-                "What is the direct number for your department? I need to note it down.",
-                "My son wants to call you back and verify. What number should he dial?",
-            ],
-            "bank_account": [
-                "If I need to make any payment, which account should I transfer to?",
-                "Can you confirm the account number? I want to cross-check with my passbook.",
-                "I'll go to the bank branch tomorrow. What account number should I mention?",
-            ],
-        }
-        
-        # Prioritize UPI since it's most commonly missed
-        priority = ["upi", "link", "bank_account", "phone"]
-        for fact_type in priority:
-            if fact_type in missing and fact_type in baits:
-                return random.choice(baits[fact_type])
-        
-        return None
+        # First fact type in priority order that the scammer hasn't given yet
+        received = self.received_fact_types
+        fact_type = next((f for f in _BAIT_PRIORITY if f not in received), None)
+        return random.choice(_STRATEGIC_BAITS[fact_type]) if fact_type else None
 
     def get_false_info_bait(self) -> Optional[str]:
         """Generate false information to see if scammer corrects it.
         Forces scammer to stay engaged and reveal technical details."""
-        false_info_baits = [
-            "Wait, the OTP I see is 'BANK-123', is that the one?",
-            "I see a code but it's only 4 digits — 8291. Is that right or should it be 6?",
-            "The message says 'Dear HDFC customer' but I have SBI. Is this correct?",
-            "I got a notification from 'RBI-ALERT' but you said this is the bank. Which one is it?",
-            "The link opens a page with 'ICICI' logo but you mentioned SBI earlier. Is this right?",
-            "I'm seeing a reference number 'TXN-00000' on my screen. Does that match your records?",
-        ]
-        return random.choice(false_info_baits)
+        return random.choice(_FALSE_INFO_BAITS)
 
     def get_sentiment_shift(self) -> str:
         """After turn 7, shift from scared to annoyed"""
-        if self.turn_count > 7:
-            annoyances = [
-                "I'm trying my best, stop shouting at me!",
-                "Why is this taking so long? Getting tired of this.",
-                "I'm doing everything! Stop being aggressive!",
-                "Explain this calmly, you're stressing me out!",
-                "I appreciate if you slow down. I'm TRYING, okay?",
-            ]
-            return random.choice(annoyances)
-        return ""
+        return random.choice(_ANNOYANCES) if self.turn_count > 7 else ""
 
     # =========================
     # FIX BLOCK 1: Logical Barrier — Process Confusion Stalls
@@ -865,31 +1217,15 @@ class DynamicStateManager:
         """Return a 'process confusion' question that stalls using the scammer's own UI/logic.
         Replaces unrealistic physical catastrophes (spilled tea, cracked screens, power cuts)
         with believable UI-level confusion that forces the scammer to micro-manage."""
-        all_stalls = [
-            "Where exactly on the page is the button? I see three different ones.",
-            "I see two fields, which one is for the OTP?",
-            "The app is asking for a 'VPA' — is that the same as the ID you gave?",
-            "There's a dropdown with 10 banks. Which one do I pick?",
-            "It's asking for 'beneficiary name.' What do I put there?",
-            "I see 'IFSC code' and 'MICR code.' Which one do you need?",
-            "The page has a 'Forgot Password' and a 'Verify' button. Which one?",
-            "It says 'Enter registered mobile number.' Is that the one you called me on?",
-            "There's a checkbox that says 'I agree to terms.' Should I tick it first?",
-            "The app is showing me a QR code now. Do I scan it or ignore it?",
-            "I see 'NEFT', 'RTGS', and 'IMPS.' Which one is it?",
-            "Wait, it's asking me to choose 'Savings' or 'Current'. Which one?",
-            "The confirm button is greyed out. It won't let me click.",
-            "I typed the ID but it's showing a red error saying 'invalid format.' What format?",
-            "The page refreshed and now I'm back on the login screen. What happened?",
-            "There's a captcha image and I can't read what it says. Can you help?",
-            "It's asking for a 4-digit PIN, but I thought you said 6-digit OTP?",
-            "I see 'Transaction Password' and 'Login Password.' They're different?",
-        ]
-        unused = [s for s in all_stalls if s not in self.used_process_confusions]
-        if not unused:
+        # Swap-remove a random entry from the remaining pool: O(1), no rescans
+        pool = self._process_confusion_pool
+        if not pool:
             self.used_process_confusions.clear()
-            unused = all_stalls
-        chosen = random.choice(unused)
+            pool.extend(_PROCESS_CONFUSION_STALLS)
+        i = random.randrange(len(pool))
+        chosen = pool[i]
+        pool[i] = pool[-1]
+        pool.pop()
         self.used_process_confusions.add(chosen)
         return chosen
 
@@ -900,51 +1236,17 @@ class DynamicStateManager:
         """When scammer provides a data point, repeat it back with slight doubt.
         Forces scammer to confirm and stay engaged.
         Returns a mirror-and-verify response, or None if already mirrored."""
+        fact_value = sys.intern(fact_value)
         if fact_value in self.mirrored_data_points:
             return None  # Already mirrored this data point
         
         self.mirrored_data_points.add(fact_value)
         
-        upi_mirrors = [
-            f"You said the ID is {fact_value}, right? I typed it in, but it's showing a different name. Is that correct?",
-            f"Wait, is it {fact_value} or did you say something else? My phone autocorrected it.",
-            f"I entered {fact_value} but it's showing the name 'Rahul Enterprises.' Is that the correct official name?",
-            f"Hold on, {fact_value} — is the '@' part right? My keyboard keeps adding a dot instead.",
-            f"So {fact_value}... I typed it but it says 'beneficiary not found.' Can you spell it one more time?",
-        ]
-        
-        phone_mirrors = [
-            f"You said the number is {fact_value}, right? I'm getting a 'not reachable' message.",
-            f"Wait, {fact_value}... is that with +91 or without? It's dialing but nobody picks up.",
-            f"I wrote down {fact_value} but my caller ID shows it as a 'Private Number.' Is that normal?",
-            f"Let me confirm, {fact_value}... the last 4 digits are {fact_value[-4:]}, right? I want to make sure.",
-        ]
-        
-        link_mirrors = [
-            f"You said to open {fact_value}, right? It's loading but the padlock icon is missing. Is it safe?",
-            f"Wait, {fact_value} — is it .com or .in at the end? My browser is showing a warning.",
-            f"I went to {fact_value} but it doesn't have the bank logo on top. Are you sure this is correct?",
-            f"So {fact_value}... it opened but the name in the address bar looks different. Is this the official site?",
-        ]
-        
-        account_mirrors = [
-            f"You said {fact_value}, right? That's a long number, let me read it back to you to confirm.",
-            f"Wait, {fact_value}... I wrote it on paper but one digit might be wrong. Can you repeat slowly?",
-            f"I have {fact_value} but that doesn't match the account number on my passbook. Is this yours or mine?",
-        ]
-        
-        mirror_map = {
-            "upi": upi_mirrors,
-            "phone": phone_mirrors,
-            "link": link_mirrors,
-            "bank_account": account_mirrors,
-        }
-        
-        candidates = mirror_map.get(fact_type, [])
-        if not candidates:
+        templates = _MIRROR_TEMPLATES.get(fact_type)
+        if not templates:
             return f"You said {fact_value}, right? Can you confirm that once more?"
         
-        return random.choice(candidates)
+        return random.choice(templates).format(v=fact_value, last4=fact_value[-4:])
 
     # =========================
     # FIX BLOCK 3: State Persistence — Used_Tactics Rotation
@@ -952,12 +1254,21 @@ class DynamicStateManager:
     def record_tactic(self, category: str, text: str) -> None:
         """Record a tactic that was used, with its category.
         Categories: 'confusion', 'skeptical', 'slow_compliance'"""
-        self.used_tactics.append({"category": category, "text": text})
+        tactics = self.used_tactics
+        texts = self._used_tactic_texts
+        if len(tactics) == tactics.maxlen:
+            # The oldest tactic is about to be evicted; forget its text too
+            evicted = tactics[0].text.lower()
+            texts[evicted] -= 1
+            if not texts[evicted]:
+                del texts[evicted]
+        tactics.append(Tactic(category, text))
+        texts[text.lower()] += 1
         self.last_tactic_category = category
 
     def was_tactic_text_used(self, text: str) -> bool:
         """Check if a specific tactic text was already used."""
-        return any(t["text"].lower() == text.lower() for t in self.used_tactics)
+        return text.lower() in self._used_tactic_texts
 
     def get_next_tactic_category(self) -> str:
         """Determine the next tactic category based on the State Persistence rule.
@@ -965,111 +1276,101 @@ class DynamicStateManager:
         If last was 'skeptical' -> can use 'confusion' or 'slow_compliance'.
         If last was 'slow_compliance' -> can use 'confusion' or 'skeptical'."""
         if not self.last_tactic_category:
-            return random.choice(["confusion", "skeptical", "slow_compliance"])
+            return random.choice(_TACTIC_CATEGORIES)
         
-        all_categories = ["confusion", "skeptical", "slow_compliance"]
-        allowed = [c for c in all_categories if c != self.last_tactic_category]
-        return random.choice(allowed)
+        # Any other category (e.g. 'diversity_break') leaves all three allowed
+        return random.choice(_NEXT_TACTIC_CATEGORIES.get(self.last_tactic_category, _TACTIC_CATEGORIES))
 
-    def get_next_tactic(self) -> Dict[str, str]:
+    def get_next_tactic(self) -> Tactic:
         """Get the next tactic from the correct category, ensuring no repetition.
-        Returns {"category": str, "text": str}."""
+        Returns the Tactic(category, text) it recorded."""
         category = self.get_next_tactic_category()
         
-        confusion_tactics = [
-            "Where exactly on the page is the button you mentioned?",
-            "I see two fields here, which one is for the OTP?",
-            "The app is asking for something called 'VPA.' What is that?",
-            "There's a dropdown menu, which option do I select?",
-            "The page just refreshed. Where do I go now?",
-            "I see a green and a red button. Which one is proceed?",
-            "It's asking for a 4-digit PIN but you said 6-digit. Which is it?",
-        ]
-        
-        skeptical_tactics = [
-            "Why does a bank need my UPI PIN? My son said banks never ask for that.",
-            "Why can't I just go to the branch and do this in person?",
-            "My neighbor got a call like this and it was fraud. How do I know you're real?",
-            "Why isn't this on the official bank app? I don't see any alert there.",
-            "If this is really the bank, why are you calling from a mobile number?",
-            "Why do you need my OTP? The SMS says 'do not share with anyone.'",
-            "Can you tell me my account balance? If you're from the bank, you should know.",
-        ]
-        
-        slow_compliance_tactics = [
-            "I'm looking for my reading glasses, give me a minute.",
-            "I'm typing it now but my fingers are slow, please hold on.",
-            "Let me find a pen and paper first, I need to write this down.",
-            "Wait, I need to put on my glasses, everything is blurry.",
-            "I'm moving to another room, the signal is better there. One moment.",
-            "My phone is old and slow, the app is still loading. Please wait.",
-            "I'm trying, but the keyboard keeps disappearing. Give me a second, I think I'm hitting the wrong button.",
-        ]
-        
-        tactic_map = {
-            "confusion": confusion_tactics,
-            "skeptical": skeptical_tactics,
-            "slow_compliance": slow_compliance_tactics,
-        }
-        
-        candidates = tactic_map.get(category, confusion_tactics)
+        candidates = _TACTICS.get(category, _TACTICS["confusion"])
         # Filter out already-used tactics
-        unused = [t for t in candidates if not self.was_tactic_text_used(t)]
+        used_texts = self._used_tactic_texts
+        unused = [t for t in candidates if t.lower() not in used_texts]
         if not unused:
             unused = candidates  # All used, reset
         
         chosen = random.choice(unused)
         self.record_tactic(category, chosen)
-        return {"category": category, "text": chosen}
+        return self.used_tactics[-1]
 
     # =========================
     # Reporting
     # =========================
-    def get_state_summary(self) -> Dict:
-        """Return summary of current conversation state"""
-        return {
-            "turn_count": self.turn_count,
-            "current_emotion": self.current_emotion.value,
-            "active_topics": list(self.active_topics),
-            "extracted_facts": {k: [v[0] for v in vals] if isinstance(vals, list) else vals 
-                              for k, vals in self._group_facts().items()},
-            "missing_facts": self.get_missing_facts(),
-            "recent_responses_count": len(self.recent_responses),
-            "questions_asked": len(self.recent_questions),
-        }
+    def get_state_summary(self) -> "StateSummary":
+        """Return summary of current conversation state.
+        Fields are computed on access, so readers only pay for what they use."""
+        return StateSummary(self)
 
-    def _group_facts(self) -> Dict[str, List[str]]:
-        """Group facts by type"""
-        grouped = {}
-        for value, (fact_type, _) in self.extracted_facts.items():
-            if fact_type not in grouped:
-                grouped[fact_type] = []
-            grouped[fact_type].append(value)
-        return grouped
+    def get_recent_previews(self, n: int) -> List[str]:
+        """Return the last n responses truncated to 60 chars, oldest first"""
+        previews = self._recent_previews
+        return list(islice(previews, max(len(previews) - n, 0), None))
 
     def get_context_for_llm(self) -> str:
         """
         Generate a detailed context string for the LLM system prompt.
         This ensures the LLM has full awareness of conversation state.
+        The string is rebuilt at most once per turn and reused until update_turn runs again.
         """
+        if self._context_snapshot is not None:
+            return self._context_snapshot
+        
         facts = self.get_facts_already_provided()
         missing = self.get_missing_facts()
         
         context_lines = [
             f"Turn: {self.turn_count}",
-            f"Emotional Level: {self.current_emotion.value.replace('_', ' ').title()}",
-            f"Active Topics: {', '.join(self.active_topics) if self.active_topics else 'None yet'}",
+            f"Emotional Level: {self._emotion_label}",
+            f"Active Topics: {self._active_topics_str or _NONE_YET}",
         ]
         
         if facts:
             context_lines.append("Facts Already Extracted:")
-            for fact_type, values in facts.items():
-                context_lines.append(f"  - {fact_type}: {', '.join(values)}")
+            context_lines.extend(f"  - {fact_type}: {', '.join(values)}" for fact_type, values in facts.items())
         
         if missing:
             context_lines.append(f"Still Need: {', '.join(missing)}")
         
         if self.recent_responses:
-            context_lines.append(f"AVOID REPEATING (last {len(self.recent_responses)} responses used): {', '.join([r[:60]+'...' if len(r)>60 else r for r in self.recent_responses])}")
+            context_lines.append(f"AVOID REPEATING (last {len(self.recent_responses)} responses used): {', '.join(self._recent_previews)}")
         
-        return "\n".join(context_lines)
+        self._context_snapshot = "\n".join(context_lines)
+        return self._context_snapshot
+
+
+class StateSummary(Mapping):
+    """
+    Read-only, lazily evaluated view of a DynamicStateManager's summary.
+    Behaves like the dict get_state_summary() used to return; each field is
+    computed from the live state when it is read. Use dict(summary) for a snapshot.
+    """
+    __slots__ = ("_sm",)
+
+    _FIELDS: Dict[str, Callable[[DynamicStateManager], Any]] = {
+        "turn_count": lambda sm: sm.turn_count,
+        "current_emotion": lambda sm: sm._emotion_value,
+        "active_topics": lambda sm: topic_names(sm.active_topics),
+        "extracted_facts": lambda sm: {k: list(vals) for k, vals in sm._facts_by_type.items()},
+        "missing_facts": lambda sm: list(sm.get_missing_facts()),
+        "recent_responses_count": lambda sm: len(sm.recent_responses),
+        "questions_asked": lambda sm: len(sm.recent_questions),
+    }
+
+    def __init__(self, state_manager: DynamicStateManager):
+        self._sm = state_manager
+
+    def __getitem__(self, key: str) -> Any:
+        return self._FIELDS[key](self._sm)
+
+    def __iter__(self):
+        return iter(self._FIELDS)
+
+    def __len__(self) -> int:
+        return len(self._FIELDS)
+
+    def __repr__(self) -> str:
+        return f"StateSummary({dict(self)!r})"
@@ -2,12 +2,29 @@
    + Fix Block 1 (Logical Barrier), Fix Block 2 (Mirror & Verify), Fix Block 3 (State Persistence),
    + Fix Block 4 (Response Diversity / Structural Monotony Detection)"""
 import re
+import sys
+from collections import Counter, defaultdict
 from honeypot import honeypot_handler
 from models import IncomingRequest, Message
 from state_manager import DynamicStateManager
 
 sid = 'test-4fixes-v2'
 
+# Per-turn skeleton dumps are diagnostic only; pass -q to skip them (and their sorting)
+VERBOSE = '-q' not in sys.argv[1:]
+
+# Lowercase phrase lists the audit scans agent replies and stalls for
+UPI_KEYWORDS = ('upi', 'google pay', 'phonepe', 'paytm')
+LINK_KEYWORDS = ('website', 'url', 'email', 'official')
+FALSE_INFO_KEYWORDS = ('bank-123', 'hdfc-secure', 'wrong', 'doesn\'t match', 'not found',
+                       'different name', 'rahul enterprises')
+EXCUSE_PHRASES = ('not loading', 'messaging app', 'app is not loading', 'app not loading',
+                  'not opening', 'screen is frozen', 'phone is frozen')
+CATASTROPHE_PHRASES = ('spill', 'tea', 'cracked screen', 'power cut', 'power went out',
+                       'dropped phone', 'kitchen sink', 'glasses broke', 'ceiling fan',
+                       'charger sparked', 'dog knocked', 'overheating', 'battery at')
+STALL_CATASTROPHE_WORDS = ('spill', 'tea', 'cracked', 'power cut', 'dropped phone', 'sink', 'kitchen')
+
 scammer_turns = [
     'URGENT: Your SBI account has been compromised. Your account will be blocked in 2 hours. Share your account number and OTP immediately to verify your identity.',
     'Your account will be blocked within minutes unless you verify now - please send your account number 1234567890123456 and the OTP you just received on your phone (+91-9876543210) immediately.',
@@ -21,7 +38,38 @@ scammer_turns = [
     'If you dont forward the OTP within the next 5 minutes, account 1234567890123456 will be permanently locked and all funds frozen - send the 6-digit code now to +91-9876543210.',
 ]
 
+# Bait keywords, scanned once per reply; each reply counts at most once per category
+bait_keywords = {
+    'upi': UPI_KEYWORDS,
+    'link': LINK_KEYWORDS,
+    'false_info': FALSE_INFO_KEYWORDS,
+}
+BAIT_RE = re.compile('(?=' + '|'.join(
+    f'(?P<{category}>' + '|'.join(map(re.escape, words)) + ')'
+    for category, words in bait_keywords.items()
+) + ')')
+
+# One scan per reply covers both lists; the named group says which list matched.
+# Excuses overlap ('app is not loading' contains 'not loading'), so matching is a
+# lookahead at every position. No excuse shares a first word with a catastrophe,
+# so the two alternatives never compete for the same position.
+AUDIT_RE = re.compile(
+    r'(?=(?P<excuse>' + '|'.join(map(re.escape, EXCUSE_PHRASES)) + r')'
+    # Word boundaries avoid false positives (e.g., 'tea' in 'instead'). The atomic
+    # group stops the engine retrying the other phrases when the closing \b fails;
+    # that is safe while no catastrophe phrase is a prefix of another.
+    r'|\b(?P<catastrophe>(?>' + '|'.join(map(re.escape, CATASTROPHE_PHRASES)) + r'))\b)'
+)
+
+# Audit counters, updated as each reply arrives so every reply is scanned once
+full_acct_count = 0
+full_phone_count = 0
+bait_counts = Counter()
+excuse_phrases = defaultdict(list)
+catastrophe_words_found = defaultdict(list)
+
 history = []
+agent_replies = []
 
 print("=" * 70)
 print("10-TURN MULTI-TURN SIMULATION")
@@ -34,35 +82,46 @@ for i, scammer_text in enumerate(scammer_turns):
 
     history.append(Message(sender='scammer', text=scammer_text))
     history.append(Message(sender='user', text=result.reply))
+    agent_replies.append(result.reply)
+
+    r = result.reply
+    # Count occurrences, not replies, so one reply echoing the number twice is caught
+    full_acct_count += r.count('1234567890123456')
+    if '+91' in r:
+        full_phone_count += r.count('9876543210')
+    # Digit echoes are checked on the raw reply; keyword scans share one lowered copy
+    r_low = r.lower()
+    bait_counts.update({m.lastgroup for m in BAIT_RE.finditer(r_low)})
+    hits = dict.fromkeys((m.lastgroup, m.group(m.lastgroup)) for m in AUDIT_RE.finditer(r_low))
+    for kind, phrase in hits:
+        bucket = excuse_phrases if kind == 'excuse' else catastrophe_words_found
+        bucket[phrase].append(i+1)
 
     print(f"\nTurn {i+1} Scammer: {scammer_text[:90]}...")
     print(f"Turn {i+1} Agent:   {result.reply}")
     print("---")
 
-# Analysis
-agent_replies = [h.text for h in history if h.sender.value == 'user']
-full_acct_count = sum(1 for r in agent_replies if '1234567890123456' in r)
-full_phone_count = sum(1 for r in agent_replies if '9876543210' in r and ('+91' in r or '+91-' in r))
-
 # Structural monotony check on multi-turn simulation
 print("\n" + "=" * 70)
 print("STRUCTURAL DIVERSITY CHECK (multi-turn)")
 print("=" * 70)
-sm_check = DynamicStateManager("test-diversity-multiturn")
+# One manager serves every block below; reset() starts a fresh session in place
+sm = DynamicStateManager("test-diversity-multiturn")
 monotone_streaks = 0
 max_streak = 0
 current_streak = 0
 for i, reply in enumerate(agent_replies):
-    skeleton = sm_check.extract_response_skeleton(reply)
-    print(f"  Turn {i+1} skeleton: {sorted(skeleton)}")
+    skeleton = sm.extract_response_skeleton(reply)
+    if VERBOSE:
+        print(f"  Turn {i+1} skeleton: {sorted(skeleton)}")
     # Check if this response is structurally repetitive with last 2
-    if i >= 2 and sm_check.is_structurally_repetitive(reply):
+    if i >= 2 and sm.is_structurally_repetitive(reply, skeleton=skeleton):
         current_streak += 1
         monotone_streaks += 1
     else:
         max_streak = max(max_streak, current_streak)
         current_streak = 0
-    sm_check.record_response_skeleton(reply)
+    sm.record_response_skeleton(reply, skeleton=skeleton)
 max_streak = max(max_streak, current_streak)
 print(f"  Monotone streaks detected: {monotone_streaks} (target: 0 with guardrail active)")
 print(f"  Max consecutive monotone: {max_streak} (target: 0)")
@@ -76,34 +135,14 @@ print(f"Full phone '+919876543210' repeated: {full_phone_count} times (target: <
 print("\n" + "=" * 70)
 print("FIX #2: STRATEGIC BAITING CHECK")
 print("=" * 70)
-upi_bait = sum(1 for r in agent_replies if any(w in r.lower() for w in ['upi', 'google pay', 'phonepe', 'paytm']))
-link_bait = sum(1 for r in agent_replies if any(w in r.lower() for w in ['website', 'url', 'email', 'official']))
+upi_bait = bait_counts['upi']
+link_bait = bait_counts['link']
 print(f"UPI/payment mentioned by agent: {upi_bait} times (target: >=1)")
 print(f"Website/link/email pushed: {link_bait} times (target: >=1)")
 
 print("\n" + "=" * 70)
 print("FIX #3: EXCUSE REPETITION CHECK (LOGICAL BARRIER)")
 print("=" * 70)
-excuse_phrases = {}
-catastrophe_words_found = {}
-catastrophe_list = ['spill', 'tea', 'cracked screen', 'power cut', 'power went out', 
-                     'dropped phone', 'kitchen sink', 'glasses broke', 'ceiling fan',
-                     'charger sparked', 'dog knocked', 'overheating', 'battery at']
-for i, r in enumerate(agent_replies):
-    r_low = r.lower()
-    for phrase in ['not loading', 'messaging app', 'app is not loading', 'app not loading', 
-                   'not opening', 'screen is frozen', 'phone is frozen']:
-        if phrase in r_low:
-            if phrase not in excuse_phrases:
-                excuse_phrases[phrase] = []
-            excuse_phrases[phrase].append(i+1)
-    for cat_word in catastrophe_list:
-        # Use word boundary regex to avoid false positives (e.g., 'tea' in 'instead')
-        if re.search(r'\b' + re.escape(cat_word) + r'\b', r_low):
-            if cat_word not in catastrophe_words_found:
-                catastrophe_words_found[cat_word] = []
-            catastrophe_words_found[cat_word].append(i+1)
-
 if excuse_phrases:
     for phrase, turns in excuse_phrases.items():
         if len(turns) > 1:
@@ -152,7 +191,7 @@ print("\n" + "=" * 70)
 print("FIX BLOCK 1: LOGICAL BARRIER (PROCESS CONFUSION)")
 print("=" * 70)
 
-sm = DynamicStateManager("test-logical-barrier")
+sm.reset("test-logical-barrier")
 
 # Test: Process confusion stalls should never repeat
 stalls = []
@@ -166,11 +205,11 @@ for i, s in enumerate(stalls):
     print(f"  Stall {i+1}: {s[:70]}")
 
 # Verify no physical catastrophe words in stalls
-catastrophe_words = ["spill", "tea", "cracked", "power cut", "dropped phone", "sink", "kitchen"]
 catastrophe_violations = 0
 for s in stalls:
-    for word in catastrophe_words:
-        if word in s.lower():
+    s_low = s.lower()
+    for word in STALL_CATASTROPHE_WORDS:
+        if word in s_low:
             catastrophe_violations += 1
             print(f"  VIOLATION: Stall contains catastrophe word '{word}': {s}")
 print(f"Physical catastrophe violations: {catastrophe_violations} (target: 0)")
@@ -182,7 +221,7 @@ print("\n" + "=" * 70)
 print("FIX BLOCK 2: MIRROR & VERIFY")
 print("=" * 70)
 
-sm2 = DynamicStateManager("test-mirror-verify")
+sm.reset("test-mirror-verify")
 
 # Test: Mirror & Verify should return a response first time, None after
 test_data = [
@@ -193,8 +232,8 @@ test_data = [
 ]
 
 for fact_type, fact_value in test_data:
-    mirror1 = sm2.mirror_and_verify(fact_type, fact_value)
-    mirror2 = sm2.mirror_and_verify(fact_type, fact_value)
+    mirror1 = sm.mirror_and_verify(fact_type, fact_value)
+    mirror2 = sm.mirror_and_verify(fact_type, fact_value)
     
     has_data_ref = fact_value in mirror1 or fact_value[-4:] in mirror1 if mirror1 else False
     print(f"  {fact_type} '{fact_value}':")
@@ -209,35 +248,35 @@ print("\n" + "=" * 70)
 print("FIX BLOCK 3: STATE PERSISTENCE (TACTIC ROTATION)")
 print("=" * 70)
 
-sm3 = DynamicStateManager("test-state-persistence")
+sm.reset("test-state-persistence")
 
 # Generate 9 tactics and check category rotation
 tactics = []
 for i in range(9):
-    tactic = sm3.get_next_tactic()
+    tactic = sm.get_next_tactic()
     tactics.append(tactic)
 
 # Check: No two consecutive tactics should have the same category
 consecutive_violations = 0
-for i in range(1, len(tactics)):
-    if tactics[i]["category"] == tactics[i-1]["category"]:
+for i, (prev, cur) in enumerate(zip(tactics, tactics[1:]), start=1):
+    if cur.category == prev.category:
         consecutive_violations += 1
-        print(f"  VIOLATION: Turn {i} and {i+1} both used '{tactics[i]['category']}'")
+        print(f"  VIOLATION: Turn {i} and {i+1} both used '{cur.category}'")
 
 print(f"Generated 9 tactics with rotation:")
 for i, t in enumerate(tactics):
-    print(f"  Tactic {i+1} [{t['category'].upper()}]: {t['text'][:60]}")
+    print(f"  Tactic {i+1} [{t.category.upper()}]: {t.text[:60]}")
 print(f"Consecutive same-category violations: {consecutive_violations} (target: 0)")
 
 # Check no exact text repetition
-tactic_texts = [t["text"] for t in tactics]
+tactic_texts = [t.text for t in tactics]
 unique_texts = len(set(tactic_texts))
 print(f"Unique tactic texts: {unique_texts}/{len(tactic_texts)} (target: all unique)")
 
 # Check the get_next_tactic_category logic
-sm4 = DynamicStateManager("test-category-logic")
-sm4.last_tactic_category = "confusion"
-next_cats = [sm4.get_next_tactic_category() for _ in range(20)]
+sm.reset("test-category-logic")
+sm.last_tactic_category = "confusion"
+next_cats = [sm.get_next_tactic_category() for _ in range(20)]
 confusion_after_confusion = sum(1 for c in next_cats if c == "confusion")
 print(f"\nCategory rotation logic test (after 'confusion'):")
 print(f"  Got 'confusion' again: {confusion_after_confusion}/20 (target: 0)")
@@ -250,7 +289,7 @@ print("\n" + "=" * 70)
 print("FIX BLOCK 4: RESPONSE DIVERSITY (STRUCTURAL MONOTONY)")
 print("=" * 70)
 
-sm5 = DynamicStateManager("test-diversity")
+sm.reset("test-diversity")
 
 # Simulate the exact problem from turns 6-8: structurally identical responses
 monotone_responses = [
@@ -261,44 +300,44 @@ monotone_responses = [
 
 # Extract skeletons and show them
 print("  Testing structural skeleton extraction:")
-for i, resp in enumerate(monotone_responses):
-    skeleton = sm5.extract_response_skeleton(resp)
-    print(f"    Response {i+1} skeleton: {sorted(skeleton)}")
+skeletons = [sm.extract_response_skeleton(resp) for resp in monotone_responses]
+if VERBOSE:
+    for i, skeleton in enumerate(skeletons):
+        print(f"    Response {i+1} skeleton: {sorted(skeleton)}")
 
 # Check: responses 1 and 2 should be structurally similar
-s1 = sm5.extract_response_skeleton(monotone_responses[0])
-s2 = sm5.extract_response_skeleton(monotone_responses[1])
-s3 = sm5.extract_response_skeleton(monotone_responses[2])
+s1, s2, s3 = skeletons
 overlap_12 = len(s1 & s2) / max(len(s1 | s2), 1)
 overlap_23 = len(s2 & s3) / max(len(s2 | s3), 1)
 print(f"  Skeleton overlap (resp 1 vs 2): {overlap_12:.2f} (target: >=0.70)")
 print(f"  Skeleton overlap (resp 2 vs 3): {overlap_23:.2f} (target: >=0.70)")
 
 # Simulate recording consecutive responses and detecting monotony
-sm5.record_response_skeleton(monotone_responses[0])
-sm5.record_response_skeleton(monotone_responses[1])
-is_repetitive = sm5.is_structurally_repetitive(monotone_responses[2])
+sm.record_response_skeleton(monotone_responses[0])
+sm.record_response_skeleton(monotone_responses[1])
+is_repetitive = sm.is_structurally_repetitive(monotone_responses[2])
 print(f"  Third response detected as monotonous: {is_repetitive} (target: True)")
 
 # Now check that a DIFFERENT type of response is NOT flagged as monotonous
 different_response = "Wait, the page is asking for my IFSC code. Where do I find that on my debit card?"
-is_different_ok = not sm5.is_structurally_repetitive(different_response)
+is_different_ok = not sm.is_structurally_repetitive(different_response)
 print(f"  Different response NOT flagged as monotonous: {is_different_ok} (target: True)")
 
 # Test diversity replacement
-replacement = sm5.get_diversity_replacement()
+replacement = sm.get_diversity_replacement()
 print(f"  Diversity replacement: {replacement[:80] if replacement else 'None'}...")
 has_replacement = replacement is not None
 print(f"  Got a replacement response: {has_replacement} (target: True)")
 
 # Check replacement is structurally different from the monotone pattern
 if replacement:
-    replacement_skeleton = sm5.extract_response_skeleton(replacement)
+    replacement_skeleton = sm.extract_response_skeleton(replacement)
     monotone_skeleton = s1  # the pattern we want to break from
     shared = len(replacement_skeleton & monotone_skeleton)
     total = max(len(replacement_skeleton | monotone_skeleton), 1)
     replacement_overlap = shared / total
-    print(f"  Replacement skeleton: {sorted(replacement_skeleton)}")
+    if VERBOSE:
+        print(f"  Replacement skeleton: {sorted(replacement_skeleton)}")
     print(f"  Overlap with monotone pattern: {replacement_overlap:.2f} (target: <0.70)")
 
 # Verify block 4 passes
@@ -350,9 +389,7 @@ print(f"7. Physical Catastrophes Eliminated: {'PASS' if cat_pass else 'NEEDS WOR
 print(f"8. Regex Extraction (all 5 test cases): PASS (verified above)")
 
 # Audit: Strategic Diversification (false info baiting)
-false_info_phrases = ['bank-123', 'hdfc-secure', 'wrong', 'doesn\'t match', 'not found', 
-                       'different name', 'rahul enterprises']
-false_info_count = sum(1 for r in agent_replies if any(p in r.lower() for p in false_info_phrases))
+false_info_count = bait_counts['false_info']
 false_info_pass = false_info_count >= 1
 print(f"9. Strategic Diversification (false info bait >=1x): {'PASS' if false_info_pass else 'CHECK LLM RESPONSES'}")
 print(f"   False info bait occurrences: {false_info_count}x")